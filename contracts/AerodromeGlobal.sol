@@ -50,23 +50,56 @@ interface IVelodromeRouter {
 }
 
 interface IStrategy {
-    function cloneStrategyVelodrome(
+    function cloneStrategyVelodromeWithImmutableArgs(
         address _vault,
         address _strategist,
         address _rewards,
         address _keeper,
         address _gauge,
+        address _stakingRewardsMulti,
         IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken0,
         IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken1
     ) external returns (address newStrategy);
 
-    function setLocalKeepVelo(uint256 _keepVelo) external;
+    function cloneStrategyVelodromeDeterministic(
+        address _vault,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        address _gauge,
+        address _stakingRewardsMulti,
+        IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken0,
+        IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken1
+    ) external returns (address newStrategy);
+
+    function predictStrategyAddress(
+        address _deployer,
+        address _gauge
+    ) external view returns (address);
+
+    function setFactoryConfig(
+        address _healthCheck,
+        address _baseFeeOracle,
+        uint256 _keepVelo,
+        uint256 _harvestProfitMinInUsdc,
+        uint256 _harvestProfitMaxInUsdc,
+        address _veloPricePool,
+        uint256 _priceTwapPoints
+    ) external;
+
+    function gauge() external view returns (address);
+
+    function emergencyExitAndUnstake() external returns (bool unstaked);
 
-    function setHealthCheck(address) external;
+    function swapRouteForToken0(
+        uint256 _index
+    ) external view returns (IVelodromeRouter.Routes memory);
 
-    function setBaseFeeOracle(address) external;
+    function swapRouteForToken1(
+        uint256 _index
+    ) external view returns (IVelodromeRouter.Routes memory);
 
-    function setVoter(address) external;
+    function copySettingsFrom(address _oldStrategy) external;
 }
 
 interface Vault {
@@ -85,6 +118,12 @@ interface Vault {
     function setDepositLimit(uint256) external;
 
     function addStrategy(address, uint256, uint256, uint256, uint256) external;
+
+    function withdrawalQueue(uint256) external view returns (address);
+
+    function governance() external view returns (address);
+
+    function migrateStrategy(address, address) external;
 }
 
 contract AerodromeGlobal {
@@ -96,11 +135,94 @@ contract AerodromeGlobal {
         address velodromeStrategy
     );
 
+    event StrategyConfigPushed(address indexed strategy, bool success);
+
+    event StrategyEmergencyExit(
+        address indexed strategy,
+        bool exited,
+        bool unstaked
+    );
+
+    event StrategyMigrated(
+        address indexed vault,
+        address oldStrategy,
+        address newStrategy
+    );
+
+    event StrategyReplacementDeployed(
+        address indexed vault,
+        address oldStrategy,
+        address newStrategy
+    );
+
+    /// @notice Our full factory configuration, used when deploying vaults and strategies.
+    /// @dev Loaded once per creation call (or once per batch) so we don't re-read storage for each vault.
+    struct FactoryConfig {
+        IRegistry registry;
+        address governance;
+        address management;
+        address guardian;
+        address treasury;
+        address keeper;
+        address healthCheck;
+        address baseFeeOracle;
+        address velodromeStratImplementation;
+        address veloVoter;
+        address veloPricePool;
+        uint256 priceTwapPoints;
+        uint256 keepVELO;
+        uint256 performanceFee;
+        uint256 managementFee;
+        uint256 depositLimit;
+        uint256 harvestProfitMinInUsdc;
+        uint256 harvestProfitMaxInUsdc;
+    }
+
+    /// @notice Our fee, keep, and threshold values, packed so they can be read with a single SLOAD.
+    /// @dev Fees are in basis points, harvest thresholds are in USDC (6 decimals).
+    struct FeeConfig {
+        uint16 performanceFee;
+        uint16 managementFee;
+        uint16 keepVELO;
+        uint48 harvestProfitMinInUsdc;
+        uint48 harvestProfitMaxInUsdc;
+        uint112 depositLimit;
+    }
+
     /* ========== STATE VARIABLES ========== */
 
     /// @notice This is a list of all vaults deployed by this factory.
     address[] public deployedVaults;
 
+    /// @notice Latest vault deployed by this factory for a given gauge.
+    /// @dev Zero address if this factory hasn't deployed a vault for the gauge.
+    mapping(address => address) public gaugeToVault;
+
+    /// @notice Latest strategy deployed by this factory for a given gauge.
+    /// @dev Zero address if this factory hasn't deployed a strategy for the gauge.
+    mapping(address => address) public gaugeToStrategy;
+
+    /// @notice Replacement strategy we deployed for a vault whose governance still needs to migrate to it.
+    /// @dev Zero address if there is none. Reused by migrateStrategies until governance migrates.
+    mapping(address => address) public pendingReplacement;
+
+    /// @notice Latest vault deployed by this factory for a given LP token.
+    /// @dev Zero address if this factory hasn't deployed a vault for the LP token.
+    mapping(address => address) public lpTokenToVault;
+
+    // gas we give each strategy to take our config, enough to set every value from zero, check our price source,
+    //  and send out any pending keepVELO
+    uint256 internal constant GAS_TO_PUSH = 400_000;
+
+    // stop pushing config to strategies once we can't give the next one its full GAS_TO_PUSH
+    uint256 internal constant MIN_GAS_TO_PUSH = 450_000;
+
+    // gas we give each strategy to exit, enough to revoke itself and withdraw everything from its gauge
+    uint256 internal constant GAS_TO_EXIT = 500_000;
+
+    // stop emergency exiting strategies once we can't give the next one its full GAS_TO_EXIT
+    uint256 internal constant MIN_GAS_TO_EXIT = 550_000;
+
     /// @notice This is specific to the protocol we are deploying automated vaults for.
     /// @dev 0 for curve, 1 for balancer/beethoven, 2 for velodrome (on optimism). This is a subcategory within our vault type AUTOMATED on the registry.
     uint256 public constant CATEGORY = 2;
@@ -139,26 +261,27 @@ contract AerodromeGlobal {
     /// @notice Address of our Velodrome strategy implementation.
     address public velodromeStratImplementation;
 
-    /// @notice The percentage of VELO we re-lock to vote for pools factories LP. Default is 0%.
-    uint256 public keepVELO;
-
     /// @notice The address of our Velodrome voter. This is where we send any keepVELO.
     address public veloVoter = 0x4444AAAACDBa5580282365e25b16309Bd770ce4a;
 
-    /// @notice Minimum profit size in USDC that we want to harvest.
-    uint256 public harvestProfitMinInUsdc = 1_000 * 1e6;
-
-    /// @notice Maximum profit size in USDC that we want to harvest (ignore gas price once we get here).
-    uint256 public harvestProfitMaxInUsdc = 100_000 * 1e6;
-
-    /// @notice Default performance fee for our factory vaults (in basis points).
-    uint256 public performanceFee = 1_000;
-
-    /// @notice Default management fee for our factory vaults (in basis points).
-    uint256 public managementFee = 0;
-
-    /// @notice Default deposit limit on our factory vaults. Set to a large number.
-    uint256 public depositLimit = 10_000_000_000_000 * 1e18;
+    /// @notice VELO/USDC pool our strategies use to price their rewards.
+    /// @dev Zero address uses the strategy's default pool.
+    address public veloPricePool;
+
+    /// @notice Number of pool observations our strategies average to price their rewards, zero for spot.
+    uint256 public priceTwapPoints;
+
+    /// @notice Our fees, keepVELO, harvest thresholds and deposit limit, packed into one slot.
+    /// @dev Use the individual views below or factoryConfig() to read these.
+    FeeConfig internal feeConfig =
+        FeeConfig({
+            performanceFee: 1_000,
+            managementFee: 0,
+            keepVELO: 0,
+            harvestProfitMinInUsdc: 1_000 * 1e6,
+            harvestProfitMaxInUsdc: 100_000 * 1e6,
+            depositLimit: 10_000_000_000_000 * 1e18
+        });
 
     /* ========== CONSTRUCTOR ========== */
 
@@ -284,7 +407,10 @@ contract AerodromeGlobal {
         if (!(msg.sender == owner || msg.sender == management)) {
             revert();
         }
-        depositLimit = _depositLimit;
+        if (_depositLimit > type(uint112).max) {
+            revert();
+        }
+        feeConfig.depositLimit = uint112(_depositLimit);
     }
 
     /// @notice Set the Velodrome strategy implementation address.
@@ -316,10 +442,61 @@ contract AerodromeGlobal {
             revert();
         }
 
-        keepVELO = _keepVELO;
+        feeConfig.keepVELO = uint16(_keepVELO);
         veloVoter = _veloVoter;
     }
 
+    /// @notice Set the price source our strategies use to value their claimable rewards.
+    /// @dev Must be called by owner or management. Applies to new strategies, use
+    ///  pushConfigToStrategies to push this to existing ones.
+    /// @param _veloPricePool VELO/USDC pool to price rewards, zero address for the strategy's default.
+    /// @param _priceTwapPoints Number of pool observations to average, zero for the spot price.
+    function setPriceSource(
+        address _veloPricePool,
+        uint256 _priceTwapPoints
+    ) external {
+        if (!(msg.sender == owner || msg.sender == management)) {
+            revert();
+        }
+        veloPricePool = _veloPricePool;
+        priceTwapPoints = _priceTwapPoints;
+    }
+
+    /// @notice Push our current health check, base fee oracle, keepVELO, harvest thresholds, and price source
+    ///  to the strategies of a range of our vaults.
+    /// @dev Must be called by owner or management. Range is over deployedVaults; _end is exclusive
+    ///  and is capped at numVaults. Stops before any strategy we can't give its full gas, so large fleets
+    ///  can be updated over several transactions by starting the next call at the returned index.
+    ///  Strategies that won't accept our config (ie, if governance has removed our access) are skipped,
+    ///  check StrategyConfigPushed events for outcomes.
+    /// @param _start Index of the first vault to update.
+    /// @param _end Index after the last vault to update.
+    /// @return nextIndex Index of the first vault we didn't get to, _end if we finished.
+    function pushConfigToStrategies(
+        uint256 _start,
+        uint256 _end
+    ) external returns (uint256 nextIndex) {
+        if (!(msg.sender == owner || msg.sender == management)) {
+            revert();
+        }
+        if (_end > deployedVaults.length) {
+            _end = deployedVaults.length;
+        }
+
+        FactoryConfig memory config = factoryConfig();
+        for (nextIndex = _start; nextIndex < _end; ++nextIndex) {
+            if (gasleft() < MIN_GAS_TO_PUSH) {
+                break;
+            }
+
+            address strategy = Vault(deployedVaults[nextIndex])
+                .withdrawalQueue(0);
+            if (strategy != address(0)) {
+                _pushConfigToStrategy(strategy, config);
+            }
+        }
+    }
+
     /// @notice Set the minimum amount of USDC profit required to harvest.
     /// @dev harvestTrigger will show true once we reach this amount of profit and gas price is acceptable.
     ///  Must be called by owner or management.
@@ -330,7 +507,10 @@ contract AerodromeGlobal {
         if (!(msg.sender == owner || msg.sender == management)) {
             revert();
         }
-        harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
+        if (_harvestProfitMinInUsdc > type(uint48).max) {
+            revert();
+        }
+        feeConfig.harvestProfitMinInUsdc = uint48(_harvestProfitMinInUsdc);
     }
 
     /// @notice Set the amount of USDC profit that will force a harvest.
@@ -343,7 +523,10 @@ contract AerodromeGlobal {
         if (!(msg.sender == owner || msg.sender == management)) {
             revert();
         }
-        harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
+        if (_harvestProfitMaxInUsdc > type(uint48).max) {
+            revert();
+        }
+        feeConfig.harvestProfitMaxInUsdc = uint48(_harvestProfitMaxInUsdc);
     }
 
     /// @notice Set the performance fee (percentage of profit) deducted from each harvest.
@@ -357,7 +540,7 @@ contract AerodromeGlobal {
         if (_performanceFee > 5_000) {
             revert();
         }
-        performanceFee = _performanceFee;
+        feeConfig.performanceFee = uint16(_performanceFee);
     }
 
     /// @notice Set the management fee (as a percentage of TVL) assessed on factory vaults.
@@ -371,17 +554,100 @@ contract AerodromeGlobal {
         if (_managementFee > 1_000) {
             revert();
         }
-        managementFee = _managementFee;
+        feeConfig.managementFee = uint16(_managementFee);
     }
 
     /* ========== VIEWS ========== */
 
+    /// @notice View our full factory configuration in a single call.
+    /// @return config All addresses, fees, and thresholds used for new vaults and strategies.
+    function factoryConfig() public view returns (FactoryConfig memory config) {
+        config.registry = registry;
+        config.governance = governance;
+        config.management = management;
+        config.guardian = guardian;
+        config.treasury = treasury;
+        config.keeper = keeper;
+        config.healthCheck = healthCheck;
+        config.baseFeeOracle = baseFeeOracle;
+        config.velodromeStratImplementation = velodromeStratImplementation;
+        config.veloVoter = veloVoter;
+        config.veloPricePool = veloPricePool;
+        config.priceTwapPoints = priceTwapPoints;
+
+        // all of these live in a single slot
+        FeeConfig memory fees = feeConfig;
+        config.keepVELO = fees.keepVELO;
+        config.performanceFee = fees.performanceFee;
+        config.managementFee = fees.managementFee;
+        config.depositLimit = fees.depositLimit;
+        config.harvestProfitMinInUsdc = fees.harvestProfitMinInUsdc;
+        config.harvestProfitMaxInUsdc = fees.harvestProfitMaxInUsdc;
+    }
+
+    /// @notice The percentage of VELO we re-lock to vote for pools factories LP. Default is 0%.
+    function keepVELO() external view returns (uint256) {
+        return feeConfig.keepVELO;
+    }
+
+    /// @notice Minimum profit size in USDC that we want to harvest.
+    function harvestProfitMinInUsdc() external view returns (uint256) {
+        return feeConfig.harvestProfitMinInUsdc;
+    }
+
+    /// @notice Maximum profit size in USDC that we want to harvest (ignore gas price once we get here).
+    function harvestProfitMaxInUsdc() external view returns (uint256) {
+        return feeConfig.harvestProfitMaxInUsdc;
+    }
+
+    /// @notice Default performance fee for our factory vaults (in basis points).
+    function performanceFee() external view returns (uint256) {
+        return feeConfig.performanceFee;
+    }
+
+    /// @notice Default management fee for our factory vaults (in basis points).
+    function managementFee() external view returns (uint256) {
+        return feeConfig.managementFee;
+    }
+
+    /// @notice Default deposit limit on our factory vaults. Set to a large number.
+    function depositLimit() external view returns (uint256) {
+        return feeConfig.depositLimit;
+    }
+
     /// @notice View all vault addresses deployed by this factory.
     /// @return Array of all deployed factory vault addresses.
     function allDeployedVaults() external view returns (address[] memory) {
         return deployedVaults;
     }
 
+    /// @notice View a page of vault addresses deployed by this factory.
+    /// @dev Use this instead of allDeployedVaults once we have too many vaults to return at once.
+    ///  Pages past the end of the list return an empty array.
+    /// @param _offset Index of the first vault to return.
+    /// @param _limit Maximum number of vaults to return.
+    /// @return Array of factory vault addresses, in deployment order.
+    function deployedVaultsPaginated(
+        uint256 _offset,
+        uint256 _limit
+    ) external view returns (address[] memory) {
+        uint256 end = deployedVaults.length;
+        if (_offset < end && _limit < end - _offset) {
+            end = _offset + _limit;
+        }
+        return _deployedVaultsSlice(_offset, end);
+    }
+
+    /// @notice View all vault addresses deployed since a given index.
+    /// @dev Indexers can pass their last synced numVaults() to only pull new vaults.
+    /// @param _index Index of the first vault to return.
+    /// @return Array of factory vault addresses from _index onwards, in deployment order.
+    function deployedVaultsSince(
+        uint256 _index
+    ) external view returns (address[] memory) {
+        return _deployedVaultsSlice(_index, deployedVaults.length);
+    }
+
     /// @notice Number of vaults deployed by this factory.
     /// @return Number of vaults deployed by this factory.
     function numVaults() external view returns (uint256) {
@@ -390,33 +656,72 @@ contract AerodromeGlobal {
 
     /// @notice Check whether, for a given gauge address, it is possible to permissionlessly
     ///  create a vault for corresponding LP token.
+    /// @dev Gauges we've already deployed for are answered from storage, others need to check the registry.
     /// @param _gauge The gauge address to check.
     /// @return Whether or not vault can be created permissionlessly.
     function canCreateVaultPermissionlessly(
         address _gauge
     ) public view returns (bool) {
+        if (gaugeToVault[_gauge] != address(0)) {
+            return false;
+        }
         return latestStandardVaultFromGauge(_gauge) == address(0);
     }
 
     /// @notice Check for the latest vault address for any LEGACY/DEFAULT/AUTOMATED type vaults.
     ///  If no vault of either LEGACY, DEFAULT, or AUTOMATED types exists for this gauge, 0x0 is returned from registry.
+    /// @dev This includes vaults not deployed by this factory. Use gaugeToVault for a cheaper lookup of our own vaults.
     /// @param _gauge The gauge to use to check for any existing vaults.
     /// @return The latest standard vault address for the specified gauge.
     function latestStandardVaultFromGauge(
         address _gauge
     ) public view returns (address) {
         // grab our lp token from our gauge
-        address lptoken = IVelodromeGauge(_gauge).stakingToken();
-        address latest;
+        return _latestStandardVault(IVelodromeGauge(_gauge).stakingToken());
+    }
 
+    /// @notice Predict the address of the strategy our factory will deploy for a given gauge.
+    /// @dev Depends on our current velodromeStratImplementation. If a strategy from this implementation
+    ///  already lives at the predicted address (ie, it has been migrated away from), new strategies
+    ///  for this gauge fall back to a regular clone at an unpredictable address.
+    /// @param _gauge The gauge address to check.
+    /// @return Predicted strategy address.
+    function predictStrategyAddress(
+        address _gauge
+    ) external view returns (address) {
+        return
+            IStrategy(velodromeStratImplementation).predictStrategyAddress(
+                address(this),
+                _gauge
+            );
+    }
+
+    // check the registry for our latest LEGACY/DEFAULT/AUTOMATED vault for a given lp token
+    function _latestStandardVault(
+        address _lptoken
+    ) internal view returns (address latest) {
         // we only care about types 0-2 here, so enforce that
         for (uint256 i; i < 3; ++i) {
-            latest = registry.latestVaultOfType(lptoken, i);
+            latest = registry.latestVaultOfType(_lptoken, i);
             if (latest != address(0)) {
                 break;
             }
         }
-        return latest;
+    }
+
+    // copy deployedVaults[_start:_end] to memory, _end must not be past the end of our array
+    function _deployedVaultsSlice(
+        uint256 _start,
+        uint256 _end
+    ) internal view returns (address[] memory vaults) {
+        if (_start >= _end) {
+            return vaults;
+        }
+
+        vaults = new address[](_end - _start);
+        for (uint256 i; i < vaults.length; ++i) {
+            vaults[i] = deployedVaults[_start + i];
+        }
     }
 
     /* ========== CORE FUNCTIONS ========== */
@@ -447,8 +752,147 @@ contract AerodromeGlobal {
                 _velodromeSwapRouteForToken1,
                 true,
                 _name,
-                _symbol
+                _symbol,
+                factoryConfig()
+            );
+    }
+
+    /// @notice Deploy factory vaults for a list of gauges in one transaction.
+    /// @dev Same as createNewVaultsAndStrategiesPermissioned, but our factory config is only read once per batch.
+    ///  Must be called by owner or management. All arrays must be the same length.
+    /// @param _gauges Addresses of the gauges to deploy new vaults for.
+    /// @param _velodromeSwapRoutesForToken0 Swap route from VELO to token0 for each gauge.
+    /// @param _velodromeSwapRoutesForToken1 Swap route from VELO to token1 for each gauge.
+    /// @param _names Name of each new vault.
+    /// @param _symbols Symbol of each new vault token.
+    /// @return vaults Addresses of the new vaults.
+    /// @return velodromeStrategies Addresses of each vault's strategy.
+    function createNewVaultsAndStrategiesPermissionedBatch(
+        address[] memory _gauges,
+        IVelodromeRouter.Routes[][] memory _velodromeSwapRoutesForToken0,
+        IVelodromeRouter.Routes[][] memory _velodromeSwapRoutesForToken1,
+        string[] memory _names,
+        string[] memory _symbols
+    )
+        external
+        returns (address[] memory vaults, address[] memory velodromeStrategies)
+    {
+        if (!(msg.sender == owner || msg.sender == management)) {
+            revert();
+        }
+
+        uint256 length = _gauges.length;
+        require(
+            _velodromeSwapRoutesForToken0.length == length &&
+                _velodromeSwapRoutesForToken1.length == length &&
+                _names.length == length &&
+                _symbols.length == length,
+            "length mismatch"
+        );
+
+        // read our config from storage once for the whole batch
+        FactoryConfig memory config = factoryConfig();
+
+        vaults = new address[](length);
+        velodromeStrategies = new address[](length);
+        for (uint256 i; i < length; ++i) {
+            (vaults[i], velodromeStrategies[i]) = _createNewVaultsAndStrategies(
+                _gauges[i],
+                _velodromeSwapRoutesForToken0[i],
+                _velodromeSwapRoutesForToken1[i],
+                true,
+                _names[i],
+                _symbols[i],
+                config
             );
+        }
+    }
+
+    /// @notice Put a list of strategies into emergency exit and pull their funds out of their gauges.
+    /// @dev Must be called by owner, management, or guardian. Strategies must have us as their vaultFactory.
+    ///  A strategy that reverts doesn't block the rest, check StrategyEmergencyExit events for outcomes.
+    ///  Strategies whose gauges won't let them withdraw are still exited and revoked, call again to retry.
+    ///  Stops before any strategy we can't give its full gas, start the next call at the returned index.
+    /// @param _strategies Array of strategy addresses to exit.
+    /// @return nextIndex Index of the first strategy we didn't get to, length of _strategies if we finished.
+    function emergencyExitStrategies(
+        address[] calldata _strategies
+    ) external returns (uint256 nextIndex) {
+        if (
+            !(msg.sender == owner ||
+                msg.sender == management ||
+                msg.sender == guardian)
+        ) {
+            revert();
+        }
+
+        for (; nextIndex < _strategies.length; ++nextIndex) {
+            if (gasleft() < MIN_GAS_TO_EXIT) {
+                break;
+            }
+            _emergencyExitStrategy(_strategies[nextIndex]);
+        }
+    }
+
+    /// @notice Put the strategies of a range of our vaults into emergency exit and pull their funds out of their gauges.
+    /// @dev Must be called by owner, management, or guardian. Range is over deployedVaults; _end is exclusive
+    ///  and is capped at numVaults. Stops before any strategy we can't give its full gas, start the next call
+    ///  at the returned index.
+    /// @param _start Index of the first vault to exit.
+    /// @param _end Index after the last vault to exit.
+    /// @return nextIndex Index of the first vault we didn't get to, _end if we finished.
+    function emergencyExitVaults(
+        uint256 _start,
+        uint256 _end
+    ) external returns (uint256 nextIndex) {
+        if (
+            !(msg.sender == owner ||
+                msg.sender == management ||
+                msg.sender == guardian)
+        ) {
+            revert();
+        }
+        if (_end > deployedVaults.length) {
+            _end = deployedVaults.length;
+        }
+
+        for (nextIndex = _start; nextIndex < _end; ++nextIndex) {
+            if (gasleft() < MIN_GAS_TO_EXIT) {
+                break;
+            }
+
+            address strategy = Vault(deployedVaults[nextIndex])
+                .withdrawalQueue(0);
+            if (strategy != address(0)) {
+                _emergencyExitStrategy(strategy);
+            }
+        }
+    }
+
+    /// @notice Deploy replacement strategies from our current implementation for a list of our vaults,
+    ///  migrating any vaults we're still governance of.
+    /// @dev Must be called by owner or management. New strategies keep the old strategy's gauge, routes, and
+    ///  per-strategy settings (see copySettingsFrom), and get our current factory config for the rest.
+    ///  Vaults whose governance has accepted emit StrategyReplacementDeployed instead of StrategyMigrated, and
+    ///  governance can then batch vault.migrateStrategy for those (see pendingReplacement). Calling this again
+    ///  before then reuses the same replacement. Funds and VELO move over in the old strategy's
+    ///  prepareMigration, and are staked on the next harvest.
+    /// @param _vaults Array of vault addresses to migrate.
+    /// @return newStrategies Array of new strategy addresses, in the same order as our vaults.
+    function migrateStrategies(
+        address[] memory _vaults
+    ) external returns (address[] memory newStrategies) {
+        if (!(msg.sender == owner || msg.sender == management)) {
+            revert();
+        }
+
+        // read our config from storage once for the whole batch
+        FactoryConfig memory config = factoryConfig();
+
+        newStrategies = new address[](_vaults.length);
+        for (uint256 i; i < _vaults.length; ++i) {
+            newStrategies[i] = _migrateStrategy(_vaults[i], config);
+        }
     }
 
     /// @notice Deploy a factory Curve vault for a given Curve gauge permissionlessly.
@@ -469,7 +913,8 @@ contract AerodromeGlobal {
                 _velodromeSwapRouteForToken1,
                 false,
                 "default",
-                "default"
+                "default",
+                factoryConfig()
             );
     }
 
@@ -480,38 +925,46 @@ contract AerodromeGlobal {
         IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken1,
         bool _permissionedUser,
         string memory _name,
-        string memory _symbol
+        string memory _symbol,
+        FactoryConfig memory _config
     ) internal returns (address vault, address velodromeStrategy) {
+        // get our lpToken from our gauge
+        address lptoken = IVelodromeGauge(_gauge).stakingToken();
+
         // if a legacy vault already exists, only permissioned users can deploy another
         if (!_permissionedUser) {
             require(
-                canCreateVaultPermissionlessly(_gauge),
+                lpTokenToVault[lptoken] == address(0) &&
+                    _latestStandardVault(lptoken) == address(0),
                 "Vault already exists"
             );
         }
 
-        // get our lpToken from our gauge
-        address lptoken = IVelodromeGauge(_gauge).stakingToken();
-
         if (_permissionedUser) {
             // allow trusted users to input the name and symbol or deploy a factory version of a legacy vault
-            vault = _createCustomVault(lptoken, _name, _symbol);
+            vault = _createCustomVault(lptoken, _name, _symbol, _config);
         } else {
             // anyone can create a vault, but it will have an auto-generated name and symbol
-            vault = _createStandardVault(lptoken);
+            vault = _createStandardVault(lptoken, _config);
         }
 
         // setup our fees, deposit limit, gov, etc
-        _setupVaultParams(vault);
+        _setupVaultParams(vault, _config);
 
         // setup our strategies as needed
         velodromeStrategy = _setupStrategies(
             vault,
             _gauge,
             _velodromeSwapRouteForToken0,
-            _velodromeSwapRouteForToken1
+            _velodromeSwapRouteForToken1,
+            _config
         );
 
+        // index our new vault and strategy so future lookups don't need the registry
+        gaugeToVault[_gauge] = vault;
+        gaugeToStrategy[_gauge] = velodromeStrategy;
+        lpTokenToVault[lptoken] = vault;
+
         emit NewAutomatedVault(
             CATEGORY,
             lptoken,
@@ -525,13 +978,14 @@ contract AerodromeGlobal {
     function _createCustomVault(
         address lptoken,
         string memory _name,
-        string memory _symbol
+        string memory _symbol,
+        FactoryConfig memory _config
     ) internal returns (address vault) {
-        vault = registry.newVault(
+        vault = _config.registry.newVault(
             lptoken,
             address(this),
-            guardian,
-            treasury,
+            _config.guardian,
+            _config.treasury,
             _name,
             _symbol,
             0,
@@ -541,13 +995,14 @@ contract AerodromeGlobal {
 
     // standard vaults create default name and symbols using on-chain data
     function _createStandardVault(
-        address lptoken
+        address lptoken,
+        FactoryConfig memory _config
     ) internal returns (address vault) {
-        vault = registry.newVault(
+        vault = _config.registry.newVault(
             lptoken,
             address(this),
-            guardian,
-            treasury,
+            _config.guardian,
+            _config.treasury,
             string(
                 abi.encodePacked(
                     "Velodrome ",
@@ -568,22 +1023,25 @@ contract AerodromeGlobal {
     }
 
     // set vault management, gov, deposit limit, and fees
-    function _setupVaultParams(address _vault) internal {
+    function _setupVaultParams(
+        address _vault,
+        FactoryConfig memory _config
+    ) internal {
         // record our new vault for posterity
         deployedVaults.push(_vault);
 
         Vault v = Vault(_vault);
-        v.setManagement(management);
+        v.setManagement(_config.management);
 
         // set governance to ychad who needs to accept before it is finalised. until then governance is this factory
-        v.setGovernance(governance);
-        v.setDepositLimit(depositLimit);
+        v.setGovernance(_config.governance);
+        v.setDepositLimit(_config.depositLimit);
 
-        if (v.managementFee() != managementFee) {
-            v.setManagementFee(managementFee);
+        if (v.managementFee() != _config.managementFee) {
+            v.setManagementFee(_config.managementFee);
         }
-        if (v.performanceFee() != performanceFee) {
-            v.setPerformanceFee(performanceFee);
+        if (v.performanceFee() != _config.performanceFee) {
+            v.setPerformanceFee(_config.performanceFee);
         }
     }
 
@@ -592,47 +1050,162 @@ contract AerodromeGlobal {
         address _vault,
         address _gauge,
         IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken0,
-        IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken1
+        IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken1,
+        FactoryConfig memory _config
     ) internal returns (address velodromeStrategy) {
         // velodrome only has one strategy
         velodromeStrategy = _addVelodromeStrategy(
             _vault,
             _gauge,
             _velodromeSwapRouteForToken0,
-            _velodromeSwapRouteForToken1
+            _velodromeSwapRouteForToken1,
+            _config
         );
     }
 
-    // deploy and attach a new curve boosted strategy using our factory's existing implementation
-    function _addVelodromeStrategy(
+    // push our config to a single strategy, catching any revert so our batch can continue
+    function _pushConfigToStrategy(
+        address _strategy,
+        FactoryConfig memory _config
+    ) internal {
+        bool success;
+        // try/catch won't catch calls to addresses without code, so check that first
+        if (_strategy.code.length > 0) {
+            try
+                IStrategy(_strategy).setFactoryConfig{gas: GAS_TO_PUSH}(
+                    _config.healthCheck,
+                    _config.baseFeeOracle,
+                    _config.keepVELO,
+                    _config.harvestProfitMinInUsdc,
+                    _config.harvestProfitMaxInUsdc,
+                    _config.veloPricePool,
+                    _config.priceTwapPoints
+                )
+            {
+                success = true;
+            } catch {}
+        }
+        emit StrategyConfigPushed(_strategy, success);
+    }
+
+    // exit a single strategy, catching any revert so our batch can continue.
+    //  a strategy can exit (and be revoked) even if its gauge won't let it unstake.
+    function _emergencyExitStrategy(address _strategy) internal {
+        bool exited;
+        bool unstaked;
+        // try/catch won't catch calls to addresses without code, so check that first
+        if (_strategy.code.length > 0) {
+            try
+                IStrategy(_strategy).emergencyExitAndUnstake{gas: GAS_TO_EXIT}()
+            returns (bool _unstaked) {
+                exited = true;
+                unstaked = _unstaked;
+            } catch {}
+        }
+        emit StrategyEmergencyExit(_strategy, exited, unstaked);
+    }
+
+    // clone a new strategy with the same gauge, routes and settings as a vault's current one, and migrate to it if we can
+    function _migrateStrategy(
         address _vault,
-        address _gauge,
-        IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken0,
-        IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken1
-    ) internal returns (address velodromeStrategy) {
-        // create the velodrome  strategy
-        velodromeStrategy = IStrategy(velodromeStratImplementation)
-            .cloneStrategyVelodrome(
+        FactoryConfig memory _config
+    ) internal returns (address newStrategy) {
+        Vault v = Vault(_vault);
+        IStrategy oldStrategy = IStrategy(v.withdrawalQueue(0));
+        address gauge = oldStrategy.gauge();
+
+        // don't leave orphans behind if governance hasn't migrated to our last replacement yet
+        newStrategy = pendingReplacement[_vault];
+        if (newStrategy == address(oldStrategy)) {
+            // governance already migrated to it, so now it's our vault's strategy
+            gaugeToStrategy[gauge] = newStrategy;
+            newStrategy = address(0);
+        }
+        if (newStrategy == address(0)) {
+            newStrategy = _deployVelodromeStrategy(
                 _vault,
-                management,
-                treasury,
-                keeper,
-                _gauge,
-                _velodromeSwapRouteForToken0,
-                _velodromeSwapRouteForToken1
+                gauge,
+                _readSwapRoute(oldStrategy, false),
+                _readSwapRoute(oldStrategy, true),
+                _config
             );
+        }
 
-        // set up health check and the base fee oracle for our new strategy
-        IStrategy(velodromeStrategy).setHealthCheck(healthCheck);
-        IStrategy(velodromeStrategy).setBaseFeeOracle(baseFeeOracle);
+        // our routes are set on deploy, but keep anything governance or management has tuned
+        IStrategy(newStrategy).copySettingsFrom(address(oldStrategy));
 
-        // must set our voter, this is used to deposit
-        IStrategy(velodromeStrategy).setVoter(veloVoter);
+        // once governance has accepted the vault, it needs to do the migration itself
+        if (v.governance() != address(this)) {
+            pendingReplacement[_vault] = newStrategy;
+            emit StrategyReplacementDeployed(
+                _vault,
+                address(oldStrategy),
+                newStrategy
+            );
+            return newStrategy;
+        }
+
+        // this moves over our debt ratio and sends our funds and VELO to the new strategy
+        v.migrateStrategy(address(oldStrategy), newStrategy);
+        gaugeToStrategy[gauge] = newStrategy;
+        delete pendingReplacement[_vault];
+
+        emit StrategyMigrated(_vault, address(oldStrategy), newStrategy);
+    }
+
+    // read a strategy's swap route one hop at a time, since strategies from older implementations don't have
+    //  swapRoutes(). we've read the whole route once the next hop reverts.
+    function _readSwapRoute(
+        IStrategy _strategy,
+        bool _forToken1
+    ) internal view returns (IVelodromeRouter.Routes[] memory route) {
+        while (true) {
+            uint256 hops = route.length;
+            IVelodromeRouter.Routes memory hop;
+            if (_forToken1) {
+                try _strategy.swapRouteForToken1(hops) returns (
+                    IVelodromeRouter.Routes memory _hop
+                ) {
+                    hop = _hop;
+                } catch {
+                    return route;
+                }
+            } else {
+                try _strategy.swapRouteForToken0(hops) returns (
+                    IVelodromeRouter.Routes memory _hop
+                ) {
+                    hop = _hop;
+                } catch {
+                    return route;
+                }
+            }
 
-        // if we're keeping any tokens, then setup our keepVELO
-        if (keepVELO > 0) {
-            IStrategy(velodromeStrategy).setLocalKeepVelo(keepVELO);
+            // routes are only a few hops, so just copy over to a longer array
+            IVelodromeRouter.Routes[]
+                memory longerRoute = new IVelodromeRouter.Routes[](hops + 1);
+            for (uint256 i; i < hops; ++i) {
+                longerRoute[i] = route[i];
+            }
+            longerRoute[hops] = hop;
+            route = longerRoute;
         }
+    }
+
+    // deploy and attach a new curve boosted strategy using our factory's existing implementation
+    function _addVelodromeStrategy(
+        address _vault,
+        address _gauge,
+        IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken0,
+        IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken1,
+        FactoryConfig memory _config
+    ) internal returns (address velodromeStrategy) {
+        velodromeStrategy = _deployVelodromeStrategy(
+            _vault,
+            _gauge,
+            _velodromeSwapRouteForToken0,
+            _velodromeSwapRouteForToken1,
+            _config
+        );
 
         // give it 100%
         uint256 veloDebtRatio = 10_000;
@@ -645,4 +1218,62 @@ contract AerodromeGlobal {
             0
         );
     }
+
+    // clone a new strategy from our current implementation and apply our config, without attaching it
+    function _deployVelodromeStrategy(
+        address _vault,
+        address _gauge,
+        IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken0,
+        IVelodromeRouter.Routes[] memory _velodromeSwapRouteForToken1,
+        FactoryConfig memory _config
+    ) internal returns (address velodromeStrategy) {
+        // create the velodrome strategy, with our pool info stored in its bytecode.
+        // our voter receives any keepVELO, so it is our strategy's stakingRewardsMulti.
+        IStrategy implementation = IStrategy(
+            _config.velodromeStratImplementation
+        );
+
+        // use our predictable address unless this implementation already deployed there for this gauge
+        if (
+            implementation
+                .predictStrategyAddress(address(this), _gauge)
+                .code
+                .length == 0
+        ) {
+            velodromeStrategy = implementation
+                .cloneStrategyVelodromeDeterministic(
+                    _vault,
+                    _config.management,
+                    _config.treasury,
+                    _config.keeper,
+                    _gauge,
+                    _config.veloVoter,
+                    _velodromeSwapRouteForToken0,
+                    _velodromeSwapRouteForToken1
+                );
+        } else {
+            velodromeStrategy = implementation
+                .cloneStrategyVelodromeWithImmutableArgs(
+                    _vault,
+                    _config.management,
+                    _config.treasury,
+                    _config.keeper,
+                    _gauge,
+                    _config.veloVoter,
+                    _velodromeSwapRouteForToken0,
+                    _velodromeSwapRouteForToken1
+                );
+        }
+
+        // set up health check, base fee oracle, keepVELO, harvest thresholds and price source for our new strategy
+        IStrategy(velodromeStrategy).setFactoryConfig(
+            _config.healthCheck,
+            _config.baseFeeOracle,
+            _config.keepVELO,
+            _config.harvestProfitMinInUsdc,
+            _config.harvestProfitMaxInUsdc,
+            _config.veloPricePool,
+            _config.priceTwapPoints
+        );
+    }
 }
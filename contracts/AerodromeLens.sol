@@ -0,0 +1,146 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+struct StrategyParams {
+    uint256 performanceFee;
+    uint256 activation;
+    uint256 debtRatio;
+    uint256 minDebtPerHarvest;
+    uint256 maxDebtPerHarvest;
+    uint256 lastReport;
+    uint256 totalDebt;
+    uint256 totalGain;
+    uint256 totalLoss;
+}
+
+interface IAerodromeGlobal {
+    function deployedVaults(uint256) external view returns (address);
+
+    function numVaults() external view returns (uint256);
+}
+
+interface IVault {
+    function withdrawalQueue(uint256) external view returns (address);
+
+    function strategies(address) external view returns (StrategyParams memory);
+}
+
+interface IStrategy {
+    function harvestTrigger(uint256 callCostinEth) external view returns (bool);
+
+    function claimableProfitInUsdc() external view returns (uint256);
+
+    function estimatedTotalAssets() external view returns (uint256);
+}
+
+/// @notice Read-only helper to pull keeper and monitoring data for every factory vault in a single call.
+/// @dev Factory vaults only ever have one strategy, so we read it from the first slot of the withdrawal queue.
+contract AerodromeLens {
+    /// @notice Snapshot of a factory vault and its strategy.
+    /// @dev If a vault or strategy view reverts, its matching *Reverted flag is set and that value is left as zero.
+    struct VaultInfo {
+        address vault;
+        address strategy;
+        bool harvestTrigger;
+        bool triggerReverted;
+        uint256 claimableProfitInUsdc;
+        bool profitReverted;
+        uint256 estimatedTotalAssets;
+        bool assetsReverted;
+        StrategyParams params;
+        bool paramsReverted;
+    }
+
+    /* ========== VIEWS ========== */
+
+    /// @notice Pull data for every vault deployed by a factory.
+    /// @dev For large factories, use vaultInfosInRange to stay under node gas caps.
+    /// @param _factory Address of the AerodromeGlobal factory.
+    /// @param _callCostInWei The keeper's estimated gas cost to call harvest() (in wei), passed to harvestTrigger.
+    /// @return infos Array of vault and strategy data, in deployedVaults order.
+    function vaultInfos(
+        address _factory,
+        uint256 _callCostInWei
+    ) external view returns (VaultInfo[] memory infos) {
+        return
+            vaultInfosInRange(
+                _factory,
+                0,
+                IAerodromeGlobal(_factory).numVaults(),
+                _callCostInWei
+            );
+    }
+
+    /// @notice Pull data for a range of vaults deployed by a factory.
+    /// @dev Range is over the factory's deployedVaults array; _end is exclusive and is capped at numVaults.
+    /// @param _factory Address of the AerodromeGlobal factory.
+    /// @param _start Index of the first vault to include.
+    /// @param _end Index after the last vault to include.
+    /// @param _callCostInWei The keeper's estimated gas cost to call harvest() (in wei), passed to harvestTrigger.
+    /// @return infos Array of vault and strategy data, in deployedVaults order.
+    function vaultInfosInRange(
+        address _factory,
+        uint256 _start,
+        uint256 _end,
+        uint256 _callCostInWei
+    ) public view returns (VaultInfo[] memory infos) {
+        IAerodromeGlobal factory = IAerodromeGlobal(_factory);
+        uint256 numVaults = factory.numVaults();
+        if (_end > numVaults) {
+            _end = numVaults;
+        }
+        if (_start >= _end) {
+            return infos;
+        }
+
+        infos = new VaultInfo[](_end - _start);
+        for (uint256 i; i < infos.length; ++i) {
+            infos[i] = vaultInfo(factory.deployedVaults(_start + i), _callCostInWei);
+        }
+    }
+
+    /// @notice Pull data for a single factory vault.
+    /// @param _vault Address of the vault.
+    /// @param _callCostInWei The keeper's estimated gas cost to call harvest() (in wei), passed to harvestTrigger.
+    /// @return info Vault and strategy data.
+    function vaultInfo(
+        address _vault,
+        uint256 _callCostInWei
+    ) public view returns (VaultInfo memory info) {
+        info.vault = _vault;
+        info.strategy = IVault(_vault).withdrawalQueue(0);
+
+        // strategy may have been removed from the queue
+        if (info.strategy == address(0)) {
+            return info;
+        }
+
+        // these depend on outside gauges, pools and oracles, so don't let one bad strategy break our whole call
+        try IVault(_vault).strategies(info.strategy) returns (
+            StrategyParams memory params
+        ) {
+            info.params = params;
+        } catch {
+            info.paramsReverted = true;
+        }
+
+        IStrategy strategy = IStrategy(info.strategy);
+        try strategy.estimatedTotalAssets() returns (uint256 assets) {
+            info.estimatedTotalAssets = assets;
+        } catch {
+            info.assetsReverted = true;
+        }
+
+        try strategy.harvestTrigger(_callCostInWei) returns (bool trigger) {
+            info.harvestTrigger = trigger;
+        } catch {
+            info.triggerReverted = true;
+        }
+
+        try strategy.claimableProfitInUsdc() returns (uint256 profit) {
+            info.claimableProfitInUsdc = profit;
+        } catch {
+            info.profitReverted = true;
+        }
+    }
+}
@@ -3,15 +3,79 @@ pragma solidity ^0.8.15;
 
 interface IStrategy {
     function harvest() external;
+
+    function tend() external;
+
+    function harvestTrigger(uint256 callCostInWei) external view returns (bool);
 }
 
 /// @notice This contract allows anyone to harvest automated yearn strategies
 /// @dev Automated yearn strategies do not swap tokens during harvests
 contract KeeperWrapper {
+    /// @notice Emitted for each strategy in a batch harvest.
+    /// @param strategy Address of the strategy we tried to harvest.
+    /// @param success True if the harvest went through, false if it reverted.
+    event HarvestResult(address indexed strategy, bool success);
+
     /// @notice Calls harvest on the strategy address entered
     /// @dev Will revert if the strategy's keeper is not set to this address
     /// @param _strategy Address of the strategy to harvest
     function harvest(address _strategy) external {
         IStrategy(_strategy).harvest();
     }
+
+    /// @notice Calls tend on the strategy address entered
+    /// @dev Will revert if the strategy's keeper is not set to this address
+    /// @param _strategy Address of the strategy to tend
+    function tend(address _strategy) external {
+        IStrategy(_strategy).tend();
+    }
+
+    /// @notice Calls harvest on each of the strategy addresses entered
+    /// @dev A strategy that reverts (including one whose keeper is not set to this address)
+    ///  is skipped so it doesn't block the rest of the batch. Check HarvestResult events for outcomes.
+    /// @param _strategies Array of strategy addresses to harvest
+    function harvestMany(address[] calldata _strategies) external {
+        for (uint256 i; i < _strategies.length; ++i) {
+            _tryHarvest(_strategies[i]);
+        }
+    }
+
+    /// @notice Checks harvestTrigger on each of the strategy addresses entered, and harvests those that return true
+    /// @dev Strategies that don't trigger (or whose trigger reverts) are skipped without an event.
+    ///  Harvests that revert are skipped as in harvestMany. Check HarvestResult events for outcomes.
+    /// @param _strategies Array of candidate strategy addresses
+    /// @param _callCostInWei The keeper's estimated gas cost to call harvest() (in wei), passed to harvestTrigger
+    /// @return harvested Number of strategies successfully harvested
+    function harvestTriggered(
+        address[] calldata _strategies,
+        uint256 _callCostInWei
+    ) external returns (uint256 harvested) {
+        for (uint256 i; i < _strategies.length; ++i) {
+            address strategy = _strategies[i];
+            if (strategy.code.length == 0) {
+                continue;
+            }
+
+            // a broken trigger shouldn't block the rest of our batch
+            try IStrategy(strategy).harvestTrigger(_callCostInWei) returns (
+                bool shouldHarvest
+            ) {
+                if (shouldHarvest && _tryHarvest(strategy)) {
+                    ++harvested;
+                }
+            } catch {}
+        }
+    }
+
+    // harvest a single strategy, catching any revert so our batch can continue
+    function _tryHarvest(address _strategy) internal returns (bool success) {
+        // try/catch won't catch calls to addresses without code, so check that first
+        if (_strategy.code.length > 0) {
+            try IStrategy(_strategy).harvest() {
+                success = true;
+            } catch {}
+        }
+        emit HarvestResult(_strategy, success);
+    }
 }
@@ -40,12 +40,6 @@ interface IVelodromeRouter {
         address to,
         uint256 deadline
     ) external;
-
-    function quoteStableLiquidityRatio(
-        address token0,
-        address token1,
-        address factory
-    ) external view returns (uint256 ratio);
 }
 
 interface IVelodromeGauge {
@@ -75,6 +69,42 @@ interface IVelodromePool {
         uint256 amountIn,
         address tokenIn
     ) external view returns (uint256 amount);
+
+    function quote(
+        address tokenIn,
+        uint256 amountIn,
+        uint256 granularity
+    ) external view returns (uint256 amountOut);
+
+    function metadata()
+        external
+        view
+        returns (
+            uint256 dec0,
+            uint256 dec1,
+            uint256 r0,
+            uint256 r1,
+            bool st,
+            address t0,
+            address t1
+        );
+
+    function swap(
+        uint256 amount0Out,
+        uint256 amount1Out,
+        address to,
+        bytes calldata data
+    ) external;
+}
+
+interface IVelodromePoolFactory {
+    function getPool(
+        address tokenA,
+        address tokenB,
+        bool stable
+    ) external view returns (address);
+
+    function getFee(address pool, bool stable) external view returns (uint256);
 }
 
 interface IDetails {
@@ -93,8 +123,8 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
 
     /* ========== STATE VARIABLES ========== */
 
-    /// @notice Velodrome gauge contract
-    IVelodromeGauge public gauge;
+    // Velodrome gauge contract, only used if we don't have immutable args. read via gauge().
+    IVelodromeGauge internal storedGauge;
 
     /// @notice Velodrome v2 router contract
     IVelodromeRouter public constant router =
@@ -103,9 +133,21 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
     /// @notice The percentage of VELO from each harvest that we send to our StakingRewardsMulti contract (out of 10,000).
     uint256 public localKeepVELO;
 
+    /// @notice keepVELO we're holding until we have enough to send to our StakingRewardsMulti contract.
+    /// @dev This VELO sits in our strategy, but isn't sold or deposited.
+    uint256 public pendingKeepVELO;
+
+    /// @notice Minimum pendingKeepVELO before we notify our StakingRewardsMulti contract.
+    /// @dev Zero (default) notifies on every harvest.
+    uint256 public minKeepVELOToNotify;
+
     /// @notice StakingRewardsMulti contract. This is where we send any keepVELO.
     IStakingRewardsMulti public stakingRewardsMulti;
 
+    /// @notice Factory that deployed this strategy, allowed to push factory-wide settings.
+    /// @dev Set to whoever cloned us, so our factory keeps access after handing off vault governance.
+    address public vaultFactory;
+
     // this means all of our fee values are in basis points
     uint256 internal constant FEE_DENOMINATOR = 10000;
 
@@ -113,25 +155,41 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
     IERC20 public constant velo =
         IERC20(0x940181a94A35A4569E4529A3CDfB74e38FD98631);
 
-    /// @notice Token0 in our pool.
-    IERC20 public poolToken0;
+    // token0 in our pool, only used if we don't have immutable args. read via poolToken0().
+    IERC20 internal storedPoolToken0;
 
-    /// @notice Token1 in our pool.
-    IERC20 public poolToken1;
+    // token1 in our pool, only used if we don't have immutable args. read via poolToken1().
+    IERC20 internal storedPoolToken1;
 
-    /// @notice Factory address that deployed our Velodrome pool.
-    address public factory;
+    // factory that deployed our pool, only used if we don't have immutable args. read via factory().
+    address internal storedFactory;
 
-    /// @notice True if our pool is stable, false if volatile.
-    bool public isStablePool;
+    // true if our pool is stable, only used if we don't have immutable args. read via isStablePool().
+    bool internal storedIsStablePool;
+
+    // EIP-1167 runtime code length, our immutable args are appended directly after it
+    uint256 internal constant CLONE_RUNTIME_LENGTH = 45;
+
+    // gauge, token0, token1, factory (20 bytes each), then isStablePool (1 byte)
+    uint256 internal constant IMMUTABLE_ARGS_LENGTH = 81;
+
+    // our swap route to go from VELO to token0, one slot per hop. read via swapRouteForToken0().
+    //  each hop is packed as: to (bits 0-159), stable (bit 160), factory index (bits 168-175).
+    //  the first hop is always from VELO, and each following hop is from the previous hop's to token.
+    uint256[] internal packedRouteForToken0;
+
+    // our swap route to go from VELO to token1, packed the same way as token0's
+    uint256[] internal packedRouteForToken1;
+
+    /// @notice Any factories used in our swap routes other than our pool's factory.
+    /// @dev Hops with factory index 0 use our pool's factory, index i uses routeFactories[i - 1].
+    address[] public routeFactories;
 
-    /// @notice Array of structs containing our swap route to go from VELO to token0.
-    /// @dev Struct is from token, to token, and true/false for stable/volatile.
-    IVelodromeRouter.Routes[] public swapRouteForToken0;
+    // bit flagging a stable hop in our packed routes
+    uint256 internal constant ROUTE_STABLE_BIT = 160;
 
-    /// @notice Array of structs containing our swap route to go from VELO to token1.
-    /// @dev Struct is from token, to token, and true/false for stable/volatile.
-    IVelodromeRouter.Routes[] public swapRouteForToken1;
+    // offset of the factory index in our packed routes
+    uint256 internal constant ROUTE_FACTORY_SHIFT = 168;
 
     /// @notice Minimum profit size in USDC that we want to harvest.
     /// @dev Only used in harvestTrigger.
@@ -141,6 +199,40 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
     /// @dev Only used in harvestTrigger.
     uint256 public harvestProfitMaxInUsdc;
 
+    /// @notice Amount of want we keep unstaked to cover small withdrawals, in basis points of our total assets.
+    /// @dev Zero (default) stakes everything.
+    uint256 public wantBufferBps;
+
+    /// @notice Minimum amount of loose want to stake with a tend, between harvests.
+    /// @dev Only used in tendTrigger. Zero (default) turns off tends.
+    uint256 public tendThreshold;
+
+    /// @notice Multiple of our keeper's call cost (in USDC) that our claimable profit must exceed to harvest (out of 10,000).
+    /// @dev Only used in harvestTrigger. Zero (default) turns this off and uses harvestProfitMinInUsdc instead.
+    uint256 public harvestCostMultiple;
+
+    /// @notice WETH/USDC pool we use to convert our keeper's call cost to USDC.
+    /// @dev Only used in harvestTrigger, when harvestCostMultiple is set.
+    address public ethPricePool;
+
+    /// @notice VELO/USDC pool we use to price our claimable rewards.
+    /// @dev Zero address (default) uses our DEFAULT_VELO_PRICE_POOL.
+    address public veloPricePool;
+
+    /// @notice Number of observations to average over when pricing VELO, zero (default) for the spot price.
+    /// @dev Packed with veloPricePool, so pricing our rewards only takes a single SLOAD.
+    uint96 public priceTwapPoints;
+
+    /// @notice Aerodrome's AERO/USDC volatile pool on Base.
+    address internal constant DEFAULT_VELO_PRICE_POOL =
+        0x6cDcb1C4A4D1C3C6d054b27AC5B77e89eAFb971d;
+
+    /// @notice Wrapped ether, used to price our keeper's call cost.
+    address internal constant weth = 0x4200000000000000000000000000000000000006;
+
+    /// @notice USDC on Base, the other side of our ethPricePool.
+    address internal constant usdc = 0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913;
+
     /// @notice Will only be true on the original deployed contract and not on clones; we don't want to clone a clone.
     bool public isOriginal = true;
 
@@ -150,6 +242,79 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
     /// @notice Set to true if one of our pools contains fee on transfer or rebasing token
     bool public isFeeOnTransfer;
 
+    /// @notice Set to true to swap any unmatched token0/token1 through our pool and deposit it during harvests.
+    /// @dev Leftovers are always included in our next harvest's deposit, this just puts them to work sooner.
+    bool public rebalanceLeftovers;
+
+    /// @notice Snapshot of our strategy's config and balances, for dashboards.
+    /// @dev Routes are in the same form as veloRouteToToken0/1, the tokens we swap through.
+    struct StrategySnapshot {
+        address gauge;
+        address poolToken0;
+        address poolToken1;
+        bool isStablePool;
+        bool isFeeOnTransfer;
+        uint256 localKeepVELO;
+        uint256 harvestProfitMinInUsdc;
+        uint256 harvestProfitMaxInUsdc;
+        uint256 stakedBalance;
+        uint256 balanceOfWant;
+        uint256 claimableRewards;
+        address[] veloRouteToToken0;
+        address[] veloRouteToToken1;
+    }
+
+    // figures for our HarvestTelemetry event, kept in memory to stay clear of stack limits
+    struct HarvestStats {
+        uint256 veloClaimed;
+        uint256 veloToRewards;
+        uint256 token0Out;
+        uint256 token1Out;
+        uint256 lpMinted;
+    }
+
+    /// @notice Emitted on every harvest with what we claimed, sold and deposited.
+    /// @param veloClaimed VELO claimed from our gauge.
+    /// @param veloToRewards VELO set aside for our StakingRewardsMulti contract (may be sent later, see pendingKeepVELO).
+    /// @param token0Out Token0 received from selling VELO (VELO kept, if token0 is VELO).
+    /// @param token1Out Token1 received from selling VELO (VELO kept, if token1 is VELO).
+    /// @param lpMinted Want minted from adding liquidity, including any rebalanced leftovers.
+    event HarvestTelemetry(
+        uint256 veloClaimed,
+        uint256 veloToRewards,
+        uint256 token0Out,
+        uint256 token1Out,
+        uint256 lpMinted
+    );
+
+    /* ========== MODIFIERS ========== */
+
+    // our factory can update settings across all of its strategies, even after handing off governance
+    modifier onlyVaultManagersOrFactory() {
+        if (
+            msg.sender != vaultFactory &&
+            msg.sender != governance() &&
+            msg.sender != vault.management()
+        ) {
+            revert();
+        }
+        _;
+    }
+
+    // our factory can pull funds from the gauge across all of its strategies during an incident
+    modifier onlyEmergencyAuthorizedOrFactory() {
+        if (
+            msg.sender != vaultFactory &&
+            msg.sender != strategist &&
+            msg.sender != governance() &&
+            msg.sender != vault.guardian() &&
+            msg.sender != vault.management()
+        ) {
+            revert();
+        }
+        _;
+    }
+
     /* ========== CONSTRUCTOR ========== */
 
     constructor(
@@ -173,6 +338,7 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
 
     /// @notice Use this to clone an exact copy of this strategy on another vault.
     /// @dev In practice, this will only be called by the factory on the template contract.
+    ///  The caller becomes our clone's vaultFactory.
     /// @param _vault Vault address we are targeting with this strategy.
     /// @param _strategist Address to grant the strategist role.
     /// @param _rewards If we have any strategist rewards, send them here.
@@ -221,14 +387,190 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
             _gauge,
             _stakingRewardsMulti,
             _veloSwapRouteForToken0,
-            _veloSwapRouteForToken1
+            _veloSwapRouteForToken1,
+            msg.sender
+        );
+
+        emit Cloned(newStrategy);
+    }
+
+    /// @notice Use this to clone a copy of this strategy with our pool constants stored in its bytecode.
+    /// @dev Gauge, pool tokens, pool factory and isStablePool are appended to the EIP-1167 clone bytecode
+    ///  and read with extcodecopy instead of from storage, making deploys and harvests cheaper.
+    ///  In practice, this will only be called by the factory on the template contract.
+    ///  The caller becomes our clone's vaultFactory.
+    /// @param _vault Vault address we are targeting with this strategy.
+    /// @param _strategist Address to grant the strategist role.
+    /// @param _rewards If we have any strategist rewards, send them here.
+    /// @param _keeper Address to grant the keeper role.
+    /// @param _gauge Gauge address for this strategy.
+    /// @param _stakingRewardsMulti Address of our StakingRewardsMulti contract.
+    /// @param _veloSwapRouteForToken0 Array of structs containing our swap route to go from VELO to token0.
+    /// @param _veloSwapRouteForToken1 Array of structs containing our swap route to go from VELO to token1.
+    /// @return newStrategy Address of our new cloned strategy.
+    function cloneStrategyVelodromeWithImmutableArgs(
+        address _vault,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        address _gauge,
+        address _stakingRewardsMulti,
+        IVelodromeRouter.Routes[] memory _veloSwapRouteForToken0,
+        IVelodromeRouter.Routes[] memory _veloSwapRouteForToken1
+    ) external returns (address newStrategy) {
+        // don't clone a clone
+        if (!isOriginal) {
+            revert();
+        }
+
+        newStrategy = _createClone(_gauge, false);
+
+        StrategyVelodromeMultiRewards(newStrategy).initialize(
+            _vault,
+            _strategist,
+            _rewards,
+            _keeper,
+            _gauge,
+            _stakingRewardsMulti,
+            _veloSwapRouteForToken0,
+            _veloSwapRouteForToken1,
+            msg.sender
+        );
+
+        emit Cloned(newStrategy);
+    }
+
+    /// @notice Use this to clone a copy of this strategy with immutable args at a deterministic address.
+    /// @dev Same as cloneStrategyVelodromeWithImmutableArgs, but deployed with CREATE2 salted by the caller
+    ///  and gauge, so the address can be known ahead of time with predictStrategyAddress. Including the
+    ///  caller in our salt means no one else can squat the address for a given deployer and gauge.
+    ///  Reverts if a strategy has already been deployed at the predicted address.
+    /// @param _vault Vault address we are targeting with this strategy.
+    /// @param _strategist Address to grant the strategist role.
+    /// @param _rewards If we have any strategist rewards, send them here.
+    /// @param _keeper Address to grant the keeper role.
+    /// @param _gauge Gauge address for this strategy.
+    /// @param _stakingRewardsMulti Address of our StakingRewardsMulti contract.
+    /// @param _veloSwapRouteForToken0 Array of structs containing our swap route to go from VELO to token0.
+    /// @param _veloSwapRouteForToken1 Array of structs containing our swap route to go from VELO to token1.
+    /// @return newStrategy Address of our new cloned strategy.
+    function cloneStrategyVelodromeDeterministic(
+        address _vault,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        address _gauge,
+        address _stakingRewardsMulti,
+        IVelodromeRouter.Routes[] memory _veloSwapRouteForToken0,
+        IVelodromeRouter.Routes[] memory _veloSwapRouteForToken1
+    ) external returns (address newStrategy) {
+        // don't clone a clone
+        if (!isOriginal) {
+            revert();
+        }
+
+        newStrategy = _createClone(_gauge, true);
+
+        StrategyVelodromeMultiRewards(newStrategy).initialize(
+            _vault,
+            _strategist,
+            _rewards,
+            _keeper,
+            _gauge,
+            _stakingRewardsMulti,
+            _veloSwapRouteForToken0,
+            _veloSwapRouteForToken1,
+            msg.sender
         );
 
         emit Cloned(newStrategy);
     }
 
+    /// @notice Predict the address of a strategy cloned with cloneStrategyVelodromeDeterministic.
+    /// @dev Only meaningful when called on the original strategy, since that is what deploys our clones.
+    ///  The prediction depends on this contract's address, so it changes if the template is swapped.
+    /// @param _deployer Address that will call cloneStrategyVelodromeDeterministic (usually our factory).
+    /// @param _gauge Gauge address for the strategy.
+    /// @return Address the strategy will be (or was) deployed to.
+    function predictStrategyAddress(
+        address _deployer,
+        address _gauge
+    ) public view returns (address) {
+        bytes32 hash = keccak256(
+            abi.encodePacked(
+                bytes1(0xff),
+                address(this),
+                _cloneSalt(_deployer, _gauge),
+                keccak256(_cloneCreationCode(_gauge))
+            )
+        );
+        return address(uint160(uint256(hash)));
+    }
+
+    // deploy an immutable-args clone, using CREATE2 if we want a predictable address
+    function _createClone(
+        address _gauge,
+        bool _deterministic
+    ) internal returns (address newStrategy) {
+        bytes memory cloneCode = _cloneCreationCode(_gauge);
+        if (_deterministic) {
+            bytes32 salt = _cloneSalt(msg.sender, _gauge);
+            assembly {
+                newStrategy := create2(
+                    0,
+                    add(cloneCode, 0x20),
+                    mload(cloneCode),
+                    salt
+                )
+            }
+        } else {
+            assembly {
+                newStrategy := create(0, add(cloneCode, 0x20), mload(cloneCode))
+            }
+        }
+
+        // create2 returns zero if something already lives at our address
+        if (newStrategy == address(0)) {
+            revert("clone failed");
+        }
+    }
+
+    // salt for our deterministic clones
+    function _cloneSalt(
+        address _deployer,
+        address _gauge
+    ) internal pure returns (bytes32) {
+        return keccak256(abi.encodePacked(_deployer, _gauge));
+    }
+
+    // creation code for an EIP-1167 clone of this contract with our pool constants appended to its runtime code.
+    //  pool info comes from the gauge so that we can predict deterministic addresses from the gauge alone.
+    //  initialize checks that the gauge's pool matches our vault's token.
+    function _cloneCreationCode(
+        address _gauge
+    ) internal view returns (bytes memory) {
+        IVelodromePool pool = IVelodromePool(
+            IVelodromeGauge(_gauge).stakingToken()
+        );
+        return
+            abi.encodePacked(
+                // standard EIP-1167 creation code, but returning our longer runtime code
+                hex"3d60",
+                uint8(CLONE_RUNTIME_LENGTH + IMMUTABLE_ARGS_LENGTH),
+                hex"80600a3d3981f3363d3d373d3d3d363d73",
+                address(this),
+                hex"5af43d82803e903d91602b57fd5bf3",
+                // immutable args, never executed since they come after the runtime code returns
+                _gauge,
+                pool.token0(),
+                pool.token1(),
+                pool.factory(),
+                pool.stable()
+            );
+    }
+
     /// @notice Initialize the strategy.
-    /// @dev This should only be called by the clone function above.
+    /// @dev This should only be called by the clone functions above.
     /// @param _vault Vault address we are targeting with this strategy.
     /// @param _strategist Address to grant the strategist role.
     /// @param _rewards If we have any strategist rewards, send them here.
@@ -236,6 +578,7 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
     /// @param _gauge Gauge address for this strategy.
     /// @param _veloSwapRouteForToken0 Array of structs containing our swap route to go from VELO to token0.
     /// @param _veloSwapRouteForToken1 Array of structs containing our swap route to go from VELO to token1.
+    /// @param _vaultFactory Factory allowed to push factory-wide settings to this strategy, zero address for none.
     function initialize(
         address _vault,
         address _strategist,
@@ -244,7 +587,8 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         address _gauge,
         address _stakingRewardsMulti,
         IVelodromeRouter.Routes[] memory _veloSwapRouteForToken0,
-        IVelodromeRouter.Routes[] memory _veloSwapRouteForToken1
+        IVelodromeRouter.Routes[] memory _veloSwapRouteForToken1,
+        address _vaultFactory
     ) public {
         _initialize(_vault, _strategist, _rewards, _keeper);
         _initializeStrat(
@@ -253,6 +597,7 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
             _veloSwapRouteForToken0,
             _veloSwapRouteForToken1
         );
+        vaultFactory = _vaultFactory;
     }
 
     // this is called by our original strategy, as well as any clones
@@ -263,57 +608,37 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         IVelodromeRouter.Routes[] memory _veloSwapRouteForToken1
     ) internal {
         // make sure that we haven't initialized this before
-        if (address(gauge) != address(0) || address(stakingRewardsMulti) != address(0)) {
+        if (address(storedGauge) != address(0) || address(stakingRewardsMulti) != address(0)) {
             revert("already initialized");
         }
 
         // set up our stakingRewardsMulti contract
         stakingRewardsMulti = IStakingRewardsMulti(_stakingRewardsMulti);
 
-        // gauge, giver of life and VELO
-        gauge = IVelodromeGauge(_gauge);
+        // clones with immutable args already have all of our pool info in their bytecode
+        if (!_hasImmutableArgs()) {
+            // gauge, giver of life and VELO
+            storedGauge = IVelodromeGauge(_gauge);
+
+            // check our pool to see if it is stable or volatile, get pool tokens as well (pool = want)
+            IVelodromePool pool = IVelodromePool(address(want));
+            storedIsStablePool = pool.stable();
+            storedPoolToken0 = IERC20(pool.token0());
+            storedPoolToken1 = IERC20(pool.token1());
+            storedFactory = pool.factory();
+        } else if (address(gauge()) != _gauge) {
+            revert("gauge mismatch");
+        }
 
         // make sure we have the right gauge for our want
-        if (gauge.stakingToken() != address(want)) {
+        if (gauge().stakingToken() != address(want)) {
             revert("gauge pool mismatch");
         }
+        IERC20 token0 = poolToken0();
+        IERC20 token1 = poolToken1();
 
-        // check our pool to see if it is stable or volatile, get pool tokens as well (pool = want)
-        IVelodromePool pool = IVelodromePool(address(want));
-        isStablePool = pool.stable();
-        poolToken0 = IERC20(pool.token0());
-        poolToken1 = IERC20(pool.token1());
-        factory = pool.factory();
-
-        // create our route state vars
-        for (uint i; i < _veloSwapRouteForToken0.length; ++i) {
-            swapRouteForToken0.push(_veloSwapRouteForToken0[i]);
-        }
-
-        for (uint i; i < _veloSwapRouteForToken1.length; ++i) {
-            swapRouteForToken1.push(_veloSwapRouteForToken1[i]);
-        }
-
-        // check to make sure our routes are reasonably correct
-        if (address(poolToken0) != address(velo)) {
-            if (
-                swapRouteForToken0[0].from != address(velo) ||
-                address(poolToken0) !=
-                swapRouteForToken0[_veloSwapRouteForToken0.length - 1].to
-            ) {
-                revert("token0 route error");
-            }
-        }
-
-        if (address(poolToken1) != address(velo)) {
-            if (
-                swapRouteForToken1[0].from != address(velo) ||
-                address(poolToken1) !=
-                swapRouteForToken1[_veloSwapRouteForToken1.length - 1].to
-            ) {
-                revert("token1 route error");
-            }
-        }
+        // create our route state vars, checking to make sure our routes are reasonably correct
+        _setSwapRoutes(_veloSwapRouteForToken0, _veloSwapRouteForToken1);
 
         // set up our baseStrategy vars
         maxReportDelay = 30 days;
@@ -323,10 +648,12 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
 
         // want = Velodrome LP/pool
         want.approve(_gauge, type(uint256).max);
-        poolToken0.safeApprove(address(router), type(uint256).max);
-        poolToken1.safeApprove(address(router), type(uint256).max);
+        token0.safeApprove(address(router), type(uint256).max);
+        token1.safeApprove(address(router), type(uint256).max);
         velo.approve(address(router), type(uint256).max);
-        velo.approve(address(stakingRewardsMulti), type(uint256).max);
+        if (_stakingRewardsMulti != address(0)) {
+            velo.approve(_stakingRewardsMulti, type(uint256).max);
+        }
 
         // set our strategy's name
         stratName = string(
@@ -344,9 +671,80 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         return stratName;
     }
 
+    /// @notice Velodrome gauge contract.
+    function gauge() public view returns (IVelodromeGauge) {
+        if (_hasImmutableArgs()) {
+            return IVelodromeGauge(_getArgAddress(0));
+        }
+        return storedGauge;
+    }
+
+    /// @notice Token0 in our pool.
+    function poolToken0() public view returns (IERC20) {
+        if (_hasImmutableArgs()) {
+            return IERC20(_getArgAddress(20));
+        }
+        return storedPoolToken0;
+    }
+
+    /// @notice Token1 in our pool.
+    function poolToken1() public view returns (IERC20) {
+        if (_hasImmutableArgs()) {
+            return IERC20(_getArgAddress(40));
+        }
+        return storedPoolToken1;
+    }
+
+    /// @notice Factory address that deployed our Velodrome pool.
+    function factory() public view returns (address) {
+        if (_hasImmutableArgs()) {
+            return _getArgAddress(60);
+        }
+        return storedFactory;
+    }
+
+    /// @notice True if our pool is stable, false if volatile.
+    function isStablePool() public view returns (bool) {
+        if (_hasImmutableArgs()) {
+            return _getArgUint8(80) != 0;
+        }
+        return storedIsStablePool;
+    }
+
+    // clones created with immutable args are exactly EIP-1167 runtime + args long
+    function _hasImmutableArgs() internal view returns (bool) {
+        return
+            address(this).code.length ==
+            CLONE_RUNTIME_LENGTH + IMMUTABLE_ARGS_LENGTH;
+    }
+
+    // read an address from the immutable args appended to our clone's code
+    function _getArgAddress(
+        uint256 _argOffset
+    ) internal view returns (address arg) {
+        uint256 codeOffset = CLONE_RUNTIME_LENGTH + _argOffset;
+        assembly {
+            let ptr := mload(0x40)
+            extcodecopy(address(), ptr, codeOffset, 20)
+            arg := shr(96, mload(ptr))
+        }
+    }
+
+    // read a single byte from the immutable args appended to our clone's code
+    function _getArgUint8(
+        uint256 _argOffset
+    ) internal view returns (uint8 arg) {
+        uint256 codeOffset = CLONE_RUNTIME_LENGTH + _argOffset;
+        assembly {
+            let ptr := mload(0x40)
+            extcodecopy(address(), ptr, codeOffset, 1)
+            arg := shr(248, mload(ptr))
+        }
+    }
+
     /// @notice Balance of want staked in Velodrome's gauge.
     function stakedBalance() public view returns (uint256) {
-        return gauge.balanceOf(address(this));
+        return gauge().balanceOf(address(this));
     }
 
     /// @notice Balance of want sitting in our strategy.
@@ -361,23 +759,112 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
 
     /// @notice Claimable VELO rewards. We use this for triggering harvests.
     function claimableRewards() public view returns (uint256) {
-        return gauge.earned(address(this));
+        return gauge().earned(address(this));
     }
 
     /// @notice Use this to check our current swap route of VELO to token0.
     /// @dev Since this is a factory, users may set non-optimal paths or liquidity may change over time.
     /// @return Array of tokens we swap through.
     function veloRouteToToken0() external view returns (address[] memory) {
-        IVelodromeRouter.Routes[] memory _route = swapRouteForToken0;
-        return _veloToRoute(_route);
+        return _veloToRoute(_unpackRoute(packedRouteForToken0));
     }
 
     /// @notice Use this to check our current swap route of VELO to token1.
     /// @dev Since this is a factory, users may set non-optimal paths or liquidity may change over time.
     /// @return Array of tokens we swap through.
     function veloRouteToToken1() external view returns (address[] memory) {
-        IVelodromeRouter.Routes[] memory _route = swapRouteForToken1;
-        return _veloToRoute(_route);
+        return _veloToRoute(_unpackRoute(packedRouteForToken1));
+    }
+
+    /// @notice View our strategy's config, balances and routes in a single call.
+    /// @return snapshot Struct of our current strategy state.
+    function strategySnapshot()
+        external
+        view
+        returns (StrategySnapshot memory snapshot)
+    {
+        snapshot.gauge = address(gauge());
+        snapshot.poolToken0 = address(poolToken0());
+        snapshot.poolToken1 = address(poolToken1());
+        snapshot.isStablePool = isStablePool();
+        snapshot.isFeeOnTransfer = isFeeOnTransfer;
+        snapshot.localKeepVELO = localKeepVELO;
+        snapshot.harvestProfitMinInUsdc = harvestProfitMinInUsdc;
+        snapshot.harvestProfitMaxInUsdc = harvestProfitMaxInUsdc;
+        snapshot.stakedBalance = stakedBalance();
+        snapshot.balanceOfWant = balanceOfWant();
+        snapshot.claimableRewards = claimableRewards();
+        snapshot.veloRouteToToken0 = _veloToRoute(
+            _unpackRoute(packedRouteForToken0)
+        );
+        snapshot.veloRouteToToken1 = _veloToRoute(
+            _unpackRoute(packedRouteForToken1)
+        );
+    }
+
+    /// @notice Both of our full swap routes, in the same form we take them in.
+    /// @dev Useful to clone a new strategy with the same routes, ie when migrating.
+    /// @return Our VELO -> token0 route and our VELO -> token1 route.
+    function swapRoutes()
+        external
+        view
+        returns (
+            IVelodromeRouter.Routes[] memory,
+            IVelodromeRouter.Routes[] memory
+        )
+    {
+        return (
+            _unpackRoute(packedRouteForToken0),
+            _unpackRoute(packedRouteForToken1)
+        );
+    }
+
+    /// @notice Hop in our swap route to go from VELO to token0.
+    /// @dev Routes are stored packed, this returns the same struct as the router uses.
+    ///  Our route is empty if token0 is VELO.
+    /// @param _index Index of the hop in our route.
+    /// @return Routes struct with from token, to token, true/false for stable/volatile, and pool factory.
+    function swapRouteForToken0(
+        uint256 _index
+    ) external view returns (IVelodromeRouter.Routes memory) {
+        return _unpackRoute(packedRouteForToken0)[_index];
+    }
+
+    /// @notice Hop in our swap route to go from VELO to token1.
+    /// @dev Routes are stored packed, this returns the same struct as the router uses.
+    ///  Our route is empty if token1 is VELO.
+    /// @param _index Index of the hop in our route.
+    /// @return Routes struct with from token, to token, true/false for stable/volatile, and pool factory.
+    function swapRouteForToken1(
+        uint256 _index
+    ) external view returns (IVelodromeRouter.Routes memory) {
+        return _unpackRoute(packedRouteForToken1)[_index];
+    }
+
+    // expand one of our packed routes into the structs our router needs
+    function _unpackRoute(
+        uint256[] storage _packedRoute
+    ) internal view returns (IVelodromeRouter.Routes[] memory route) {
+        uint256 hops = _packedRoute.length;
+        route = new IVelodromeRouter.Routes[](hops);
+        address poolFactory = factory();
+        address from = address(velo);
+
+        for (uint256 i; i < hops; ++i) {
+            uint256 hop = _packedRoute[i];
+            uint256 factoryIndex = uint8(hop >> ROUTE_FACTORY_SHIFT);
+            address to = address(uint160(hop));
+
+            route[i] = IVelodromeRouter.Routes(
+                from,
+                to,
+                (hop >> ROUTE_STABLE_BIT) & 1 == 1,
+                factoryIndex == 0
+                    ? poolFactory
+                    : routeFactories[factoryIndex - 1]
+            );
+            from = to;
+        }
     }
 
     /// @dev Credit to beefy for this useful helper function, 0xd0B6809f9b6FdeC41280e0C843B4C232425d8015, MIT license
@@ -385,7 +872,8 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         IVelodromeRouter.Routes[] memory _route
     ) internal pure returns (address[] memory) {
         address[] memory route = new address[](_route.length + 1);
-        route[0] = _route[0].from;
+        // all of our routes start from VELO
+        route[0] = address(velo);
         for (uint i; i < _route.length; ++i) {
             route[i + 1] = _route[i].to;
         }
@@ -402,8 +890,17 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         returns (uint256 _profit, uint256 _loss, uint256 _debtPayment)
     {
         // harvest no matter what
-        gauge.getReward(address(this));
+        HarvestStats memory stats;
         uint256 veloBalance = velo.balanceOf(address(this));
+        gauge().getReward(address(this));
+        stats.veloClaimed = velo.balanceOf(address(this)) - veloBalance;
+
+        // any keepVELO we're still holding isn't ours to sell. governance may have swept some of our VELO,
+        //  so we can't be holding more than we had before claiming.
+        uint256 pending = Math.min(pendingKeepVELO, veloBalance);
+        unchecked {
+            veloBalance = veloBalance - pending + stats.veloClaimed;
+        }
 
         // by default this is zero, but if we want any for our StakingRewardsMulti contract this will be used
         uint256 _localKeepVELO = localKeepVELO;
@@ -411,90 +908,38 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
             uint256 sendToRewardsMulti;
             unchecked {
                 sendToRewardsMulti = (veloBalance * _localKeepVELO) / FEE_DENOMINATOR;
+                veloBalance -= sendToRewardsMulti;
             }
-            if (sendToRewardsMulti > 0) {
-                stakingRewardsMulti.notifyRewardAmount(address(velo), sendToRewardsMulti);
-            }
-            veloBalance = velo.balanceOf(address(this));
+            pending += sendToRewardsMulti;
+            stats.veloToRewards = sendToRewardsMulti;
+        }
+
+        // only send our keepVELO once we have enough to be worth the notify
+        if (
+            pending > 0 &&
+            pending >= minKeepVELOToNotify &&
+            address(stakingRewardsMulti) != address(0)
+        ) {
+            stakingRewardsMulti.notifyRewardAmount(address(velo), pending);
+            pending = 0;
+        }
+        if (pending != pendingKeepVELO) {
+            pendingKeepVELO = pending;
         }
 
         // don't bother if we don't get at least 10 VELO
         if (veloBalance > 10e18) {
-            // sell rewards for more want, have to add from both sides.
-            uint256 amountToSwapToken0 = veloBalance / 2;
-            uint256 amountToSwapToken1 = veloBalance - amountToSwapToken0;
-
-            // if stable, do some more fancy math, not as easy as swapping half
-            if (isStablePool) {
-                uint256 ratio = router.quoteStableLiquidityRatio(
-                    address(poolToken0),
-                    address(poolToken1),
-                    factory
-                );
-                amountToSwapToken1 = (veloBalance * ratio) / 1e18;
-                amountToSwapToken0 = veloBalance - amountToSwapToken1;
-            }
-
-            if (address(poolToken0) != address(velo)) {
-                if (isFeeOnTransfer) {
-                    router
-                        .swapExactTokensForTokensSupportingFeeOnTransferTokens(
-                            amountToSwapToken0,
-                            0,
-                            swapRouteForToken0,
-                            address(this),
-                            block.timestamp
-                        );
-                } else {
-                    router.swapExactTokensForTokens(
-                        amountToSwapToken0,
-                        0,
-                        swapRouteForToken0,
-                        address(this),
-                        block.timestamp
-                    );
-                }
-            }
-
-            if (address(poolToken1) != address(velo)) {
-                if (isFeeOnTransfer) {
-                    router
-                        .swapExactTokensForTokensSupportingFeeOnTransferTokens(
-                            amountToSwapToken1,
-                            0,
-                            swapRouteForToken1,
-                            address(this),
-                            block.timestamp
-                        );
-                } else {
-                    router.swapExactTokensForTokens(
-                        amountToSwapToken1,
-                        0,
-                        swapRouteForToken1,
-                        address(this),
-                        block.timestamp
-                    );
-                }
-            }
-
-            // check and see what we have after swaps
-            uint256 balanceToken0 = poolToken0.balanceOf(address(this));
-            uint256 balanceToken1 = poolToken1.balanceOf(address(this));
-
-            // deposit our liquidity, should have minimal remaining in strategy after this
-            router.addLiquidity(
-                address(poolToken0),
-                address(poolToken1),
-                isStablePool,
-                balanceToken0,
-                balanceToken1,
-                0,
-                0,
-                address(this),
-                block.timestamp
-            );
+            _compoundRewards(veloBalance, stats);
         }
 
+        emit HarvestTelemetry(
+            stats.veloClaimed,
+            stats.veloToRewards,
+            stats.token0Out,
+            stats.token1Out,
+            stats.lpMinted
+        );
+
         // serious loss should never happen, but if it does (for instance, if Ramses is hacked), let's record it accurately
         uint256 assets = estimatedTotalAssets();
         uint256 debt = vault.strategies(address(this)).totalDebt;
@@ -530,17 +975,373 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         }
     }
 
+    // sell our VELO for both pool tokens and deposit them as liquidity
+    function _compoundRewards(
+        uint256 _veloBalance,
+        HarvestStats memory _stats
+    ) internal {
+        // read these once, they may come from our bytecode or storage
+        IERC20 token0 = poolToken0();
+        IERC20 token1 = poolToken1();
+        bool stable = isStablePool();
+
+        // sell rewards for more want, have to add from both sides.
+        uint256 amountToSwapToken0 = _veloBalance / 2;
+        uint256 amountToSwapToken1 = _veloBalance - amountToSwapToken0;
+
+        // if stable, do some more fancy math, not as easy as swapping half
+        if (stable) {
+            amountToSwapToken1 = _stableSwapAmount(_veloBalance, true);
+            amountToSwapToken0 = _veloBalance - amountToSwapToken1;
+        } else if (
+            address(token0) == address(velo) &&
+            _isRouteThroughOurPool(packedRouteForToken1, token1)
+        ) {
+            // if we're selling VELO into our own pool, account for the price impact and fee we cause
+            amountToSwapToken1 = _optimalZapAmount(_veloBalance, true);
+            amountToSwapToken0 = _veloBalance - amountToSwapToken1;
+        } else if (
+            address(token1) == address(velo) &&
+            _isRouteThroughOurPool(packedRouteForToken0, token0)
+        ) {
+            amountToSwapToken0 = _optimalZapAmount(_veloBalance, false);
+            amountToSwapToken1 = _veloBalance - amountToSwapToken0;
+        }
+
+        // swap along both of our routes, only selling through any shared hops once
+        (_stats.token0Out, _stats.token1Out) = _sellRewards(
+            amountToSwapToken0,
+            amountToSwapToken1
+        );
+
+        // deposit our liquidity, including anything left over from previous harvests
+        _stats.lpMinted = _addAllLiquidity(token0, token1, stable);
+
+        // if we want, swap whatever didn't match and deposit that too. we swap on our pool directly,
+        //  which can't account for fee on transfer tokens.
+        if (rebalanceLeftovers && !isFeeOnTransfer) {
+            _stats.lpMinted += _rebalanceLeftovers(token0, token1, stable);
+        }
+    }
+
+    // how much value should go to one side to add liquidity to our stable pool in the right proportions.
+    //  we need amounts in the ratio of our reserves x:y, so by value token1 gets y / (y + p * x), where
+    //  p = (3x²y + y³) / (x³ + 3xy²) is the marginal price of token0 on the x³y + xy³ curve.
+    //  this simplifies to (x² + 3y²) / (4x² + 4y²) for token1 and (3x² + y²) / (4x² + 4y²) for token0,
+    //  using reserves normalized to 18 decimals.
+    function _stableSwapAmount(
+        uint256 _amount,
+        bool _toToken1
+    ) internal view returns (uint256) {
+        (
+            uint256 decimals0,
+            uint256 decimals1,
+            uint256 reserve0,
+            uint256 reserve1,
+            ,
+            ,
+
+        ) = IVelodromePool(address(want)).metadata();
+        uint256 x = (reserve0 * 1e18) / decimals0;
+        uint256 y = (reserve1 * 1e18) / decimals1;
+
+        uint256 sumOfSquares = x * x + y * y;
+        if (sumOfSquares == 0) {
+            return _amount / 2;
+        }
+
+        if (_toToken1) {
+            return Math.mulDiv(_amount, x * x + 3 * y * y, 4 * sumOfSquares);
+        }
+        return Math.mulDiv(_amount, 3 * x * x + y * y, 4 * sumOfSquares);
+    }
+
+    // true if a packed route is a single volatile VELO -> _token hop on our pool's factory, ie our own pool
+    function _isRouteThroughOurPool(
+        uint256[] storage _packedRoute,
+        IERC20 _token
+    ) internal view returns (bool) {
+        // no stable flag and factory index 0, so the packed hop is just the token address
+        return
+            _packedRoute.length == 1 &&
+            _packedRoute[0] == uint256(uint160(address(_token)));
+    }
+
+    // how much of one of our tokens to swap through our volatile pool so that what's left and what we get
+    //  back match our post-swap reserves. with fee multiplier F = 10,000 - fee and input reserve r, the
+    //  optimal swap is s = (sqrt(r²(10,000 + F)² + 4 * F * 10,000 * a * r) - r(10,000 + F)) / 2F for a tokens.
+    function _optimalZapAmount(
+        uint256 _amount,
+        bool _tokenInIsToken0
+    ) internal view returns (uint256) {
+        (, , uint256 reserve0, uint256 reserve1, , , ) = IVelodromePool(
+            address(want)
+        ).metadata();
+        uint256 reserveIn = _tokenInIsToken0 ? reserve0 : reserve1;
+        if (reserveIn == 0) {
+            return _amount / 2;
+        }
+
+        uint256 feeMultiplier = FEE_DENOMINATOR -
+            IVelodromePoolFactory(factory()).getFee(address(want), false);
+        uint256 b = reserveIn * (FEE_DENOMINATOR + feeMultiplier);
+        return
+            (Math.sqrt(
+                b * b + 4 * feeMultiplier * FEE_DENOMINATOR * _amount * reserveIn
+            ) - b) / (2 * feeMultiplier);
+    }
+
+    // add all of our token0 and token1 as liquidity, should have minimal remaining in strategy after this
+    function _addAllLiquidity(
+        IERC20 _token0,
+        IERC20 _token1,
+        bool _stable
+    ) internal returns (uint256 liquidity) {
+        (, , liquidity) = router.addLiquidity(
+            address(_token0),
+            address(_token1),
+            _stable,
+            _poolTokenBalance(_token0),
+            _poolTokenBalance(_token1),
+            0,
+            0,
+            address(this),
+            block.timestamp
+        );
+    }
+
+    // our balance of a pool token, not counting any keepVELO we're holding if it's VELO
+    function _poolTokenBalance(IERC20 _token) internal view returns (uint256) {
+        uint256 balance = _token.balanceOf(address(this));
+        if (address(_token) == address(velo)) {
+            uint256 pending = pendingKeepVELO;
+            return balance > pending ? balance - pending : 0;
+        }
+        return balance;
+    }
+
+    // swap part of whichever token addLiquidity didn't use through our own pool, then deposit again
+    function _rebalanceLeftovers(
+        IERC20 _token0,
+        IERC20 _token1,
+        bool _stable
+    ) internal returns (uint256 liquidity) {
+        uint256 balanceToken0 = _poolTokenBalance(_token0);
+        uint256 balanceToken1 = _poolTokenBalance(_token1);
+        if (balanceToken0 == 0 && balanceToken1 == 0) {
+            return;
+        }
+
+        // compare against our reserves to see which side we have too much of
+        (, , uint256 reserve0, uint256 reserve1, , , ) = IVelodromePool(
+            address(want)
+        ).metadata();
+        bool excessToken0 = balanceToken0 * reserve1 > balanceToken1 * reserve0;
+        uint256 excess = excessToken0 ? balanceToken0 : balanceToken1;
+
+        uint256 swapAmount = _stable
+            ? _stableSwapAmount(excess, excessToken0)
+            : _optimalZapAmount(excess, excessToken0);
+        if (swapAmount == 0) {
+            return;
+        }
+
+        IVelodromeRouter.Routes memory hop = excessToken0
+            ? IVelodromeRouter.Routes(
+                address(_token0),
+                address(_token1),
+                _stable,
+                factory()
+            )
+            : IVelodromeRouter.Routes(
+                address(_token1),
+                address(_token0),
+                _stable,
+                factory()
+            );
+
+        // don't bother if our leftovers are too small to get anything back
+        if (_swapOnPool(swapAmount, hop)) {
+            liquidity = _addAllLiquidity(_token0, _token1, _stable);
+        }
+    }
+
+    // sell VELO for our pool tokens. if our routes start with the same hops, swap our combined VELO
+    //  through those once and split the output where our routes diverge.
+    //  returns how much of each pool token we got, or VELO kept if that pool token is VELO.
+    function _sellRewards(
+        uint256 _amountToSwapToken0,
+        uint256 _amountToSwapToken1
+    ) internal returns (uint256 token0Out, uint256 token1Out) {
+        // routes for a pool token that is VELO are empty
+        IVelodromeRouter.Routes[] memory route0 = _unpackRoute(
+            packedRouteForToken0
+        );
+        IVelodromeRouter.Routes[] memory route1 = _unpackRoute(
+            packedRouteForToken1
+        );
+
+        // hops always start from the previous hop's to token, so matching packed hops are the same swap
+        uint256 sharedHops;
+        while (
+            sharedHops < route0.length &&
+            sharedHops < route1.length &&
+            packedRouteForToken0[sharedHops] == packedRouteForToken1[sharedHops]
+        ) {
+            ++sharedHops;
+        }
+
+        if (sharedHops > 0) {
+            uint256 totalToSwap = _amountToSwapToken0 + _amountToSwapToken1;
+            uint256 sharedOut = _swapForOutput(
+                totalToSwap,
+                _sliceRoute(route0, 0, sharedHops)
+            );
+
+            // split what we got in the same proportions as our VELO
+            _amountToSwapToken0 =
+                (sharedOut * _amountToSwapToken0) /
+                totalToSwap;
+            _amountToSwapToken1 = sharedOut - _amountToSwapToken0;
+
+            route0 = _sliceRoute(route0, sharedHops, route0.length);
+            route1 = _sliceRoute(route1, sharedHops, route1.length);
+        }
+
+        // if we've run out of route, we already hold the token
+        if (route0.length > 0 && _amountToSwapToken0 > 0) {
+            token0Out = _swapForOutput(_amountToSwapToken0, route0);
+        } else {
+            token0Out = _amountToSwapToken0;
+        }
+
+        if (route1.length > 0 && _amountToSwapToken1 > 0) {
+            token1Out = _swapForOutput(_amountToSwapToken1, route1);
+        } else {
+            token1Out = _amountToSwapToken1;
+        }
+    }
+
+    // swap along a route, returning how much of the final token we actually received
+    function _swapForOutput(
+        uint256 _amountIn,
+        IVelodromeRouter.Routes[] memory _route
+    ) internal returns (uint256) {
+        IERC20 tokenOut = IERC20(_route[_route.length - 1].to);
+        uint256 balanceBefore = tokenOut.balanceOf(address(this));
+        _swap(_amountIn, _route);
+        return tokenOut.balanceOf(address(this)) - balanceBefore;
+    }
+
+    // swap along a route, going straight to the pool for simple single hops and using our router otherwise
+    function _swap(
+        uint256 _amountIn,
+        IVelodromeRouter.Routes[] memory _route
+    ) internal {
+        // only use pools from our own factory directly, since we know its interface
+        if (
+            _route.length == 1 &&
+            !isFeeOnTransfer &&
+            _route[0].factory == factory()
+        ) {
+            if (_swapOnPool(_amountIn, _route[0])) {
+                return;
+            }
+        }
+
+        if (isFeeOnTransfer) {
+            router.swapExactTokensForTokensSupportingFeeOnTransferTokens(
+                _amountIn,
+                0,
+                _route,
+                address(this),
+                block.timestamp
+            );
+        } else {
+            router.swapExactTokensForTokens(
+                _amountIn,
+                0,
+                _route,
+                address(this),
+                block.timestamp
+            );
+        }
+    }
+
+    // swap directly against a pool, skipping the router's extra transfer and bookkeeping.
+    //  returns false without doing anything if the pool doesn't exist or we'd get nothing back.
+    function _swapOnPool(
+        uint256 _amountIn,
+        IVelodromeRouter.Routes memory _hop
+    ) internal returns (bool) {
+        address pool = IVelodromePoolFactory(_hop.factory).getPool(
+            _hop.from,
+            _hop.to,
+            _hop.stable
+        );
+        if (pool == address(0)) {
+            return false;
+        }
+
+        uint256 amountOut = IVelodromePool(pool).getAmountOut(
+            _amountIn,
+            _hop.from
+        );
+        if (amountOut == 0) {
+            return false;
+        }
+        IERC20(_hop.from).safeTransfer(pool, _amountIn);
+
+        // pool tokens are sorted by address
+        if (_hop.from < _hop.to) {
+            IVelodromePool(pool).swap(0, amountOut, address(this), "");
+        } else {
+            IVelodromePool(pool).swap(amountOut, 0, address(this), "");
+        }
+        return true;
+    }
+
+    // copy hops [_start, _end) of a route
+    function _sliceRoute(
+        IVelodromeRouter.Routes[] memory _route,
+        uint256 _start,
+        uint256 _end
+    ) internal pure returns (IVelodromeRouter.Routes[] memory slice) {
+        slice = new IVelodromeRouter.Routes[](_end - _start);
+        for (uint256 i; i < slice.length; ++i) {
+            slice[i] = _route[_start + i];
+        }
+    }
+
     function adjustPosition(uint256 _debtOutstanding) internal override {
         // if in emergency exit, we don't want to deploy any more funds
         if (emergencyExit) {
             return;
         }
 
-        // Deposit all of our LP tokens in the gauge
-        uint256 toInvest = balanceOfWant();
+        // Deposit our LP tokens in the gauge, minus anything we keep loose for withdrawals
+        uint256 toInvest = _wantToInvest();
         if (toInvest > 0) {
-            gauge.deposit(toInvest);
+            gauge().deposit(toInvest);
+        }
+    }
+
+    // loose want above our buffer, which is a share of our total assets
+    function _wantToInvest() internal view returns (uint256) {
+        uint256 wantBalance = balanceOfWant();
+        uint256 _wantBufferBps = wantBufferBps;
+        if (_wantBufferBps == 0) {
+            return wantBalance;
+        }
+
+        uint256 buffer = ((wantBalance + stakedBalance()) * _wantBufferBps) /
+            FEE_DENOMINATOR;
+        if (wantBalance > buffer) {
+            unchecked {
+                return wantBalance - buffer;
+            }
         }
+        return 0;
     }
 
     function liquidatePosition(
@@ -556,7 +1357,7 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
                     neededFromStaked = _amountNeeded - wantBal;
                 }
                 // withdraw whatever extra funds we need
-                gauge.withdraw(Math.min(stakedBal, neededFromStaked));
+                gauge().withdraw(Math.min(stakedBal, neededFromStaked));
             }
             uint256 withdrawnBal = balanceOfWant();
             _liquidatedAmount = Math.min(_amountNeeded, withdrawnBal);
@@ -574,22 +1375,52 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         uint256 stakedBal = stakedBalance();
         if (stakedBal > 0) {
             // don't bother withdrawing zero, save gas where we can
-            gauge.withdraw(stakedBal);
+            gauge().withdraw(stakedBal);
         }
         return balanceOfWant();
     }
 
-    // migrate our want token to a new strategy if needed, as well as our VELO
+    // migrate our want token to a new strategy if needed, as well as our VELO and any leftover pool tokens
     function prepareMigration(address _newStrategy) internal override {
         uint256 stakedBal = stakedBalance();
         if (stakedBal > 0) {
-            gauge.withdraw(stakedBal);
+            gauge().withdraw(stakedBal);
         }
+
+        // send out any keepVELO we're holding so it isn't sold by our new strategy
+        _notifyPendingKeepVELO();
         uint256 veloBal = velo.balanceOf(address(this));
 
         if (veloBal > 0) {
             velo.safeTransfer(_newStrategy, veloBal);
         }
+
+        // if either of these is VELO, we've already sent it
+        IERC20 token0 = poolToken0();
+        uint256 token0Bal = token0.balanceOf(address(this));
+        if (token0Bal > 0) {
+            token0.safeTransfer(_newStrategy, token0Bal);
+        }
+
+        IERC20 token1 = poolToken1();
+        uint256 token1Bal = token1.balanceOf(address(this));
+        if (token1Bal > 0) {
+            token1.safeTransfer(_newStrategy, token1Bal);
+        }
+    }
+
+    // send all of our pendingKeepVELO to our StakingRewardsMulti contract
+    function _notifyPendingKeepVELO() internal {
+        uint256 pending = pendingKeepVELO;
+        if (pending > 0 && address(stakingRewardsMulti) != address(0)) {
+            pendingKeepVELO = 0;
+
+            // governance may have swept some of our VELO
+            pending = Math.min(pending, velo.balanceOf(address(this)));
+            if (pending > 0) {
+                stakingRewardsMulti.notifyRewardAmount(address(velo), pending);
+            }
+        }
     }
 
     // want is blocked by default, add any other tokens to protect from gov here.
@@ -600,9 +1431,40 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         returns (address[] memory)
     {}
 
+    /// @notice Enter emergency exit and pull all of our want out of the gauge right away.
+    /// @dev Can be called by emergency authorized roles or our factory. Want stays loose in the strategy
+    ///  until our next harvest returns it to the vault, but it is no longer exposed to the gauge.
+    ///  If our gauge reverts, we still stay in emergency exit and revoked, and this can be called again later.
+    /// @return unstaked True if nothing is left in our gauge, false if our gauge wouldn't let us withdraw.
+    function emergencyExitAndUnstake()
+        external
+        onlyEmergencyAuthorizedOrFactory
+        returns (bool unstaked)
+    {
+        // same as setEmergencyExit, but don't revert if we're already exiting
+        if (!emergencyExit) {
+            emergencyExit = true;
+            if (vault.strategies(address(this)).debtRatio != 0) {
+                vault.revokeStrategy();
+            }
+            emit EmergencyExitEnabled();
+        }
+
+        // a paused or exploited gauge shouldn't undo our exit
+        IVelodromeGauge _gauge = gauge();
+        try _gauge.balanceOf(address(this)) returns (uint256 stakedBal) {
+            if (stakedBal == 0) {
+                return true;
+            }
+            try _gauge.withdraw(stakedBal) {
+                unstaked = true;
+            } catch {}
+        } catch {}
+    }
+
     /// @notice In case we enter emergencyExit before harvesting, vault managers can use this function to claim our last rewards.
     function manualRewardClaim() external onlyVaultManagers {
-        gauge.getReward(address(this));
+        gauge().getReward(address(this));
     }
 
     /* ========== KEEP3RS ========== */
@@ -614,7 +1476,9 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
      *  Don't harvest if a strategy is inactive.
      *  If we exceed our max delay, then harvest no matter what. For
      *  our min delay, credit threshold, and manual force trigger,
-     *  only harvest if our gas price is acceptable.
+     *  only harvest if our gas price is acceptable. If harvestCostMultiple
+     *  is set, harvest once our profit covers our call cost by that multiple,
+     *  ignoring harvestProfitMinInUsdc (a zero call cost harvests on any profit).
      *
      * @param callCostinEth The keeper's estimated gas cost to call harvest() (in wei).
      * @return True if harvest() should be called, false otherwise.
@@ -633,6 +1497,18 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
             return true;
         }
 
+        // if we're gas aware, harvest once our profit covers our keeper's actual cost by enough. this replaces
+        //  our min profit check, and since it accounts for gas directly, we don't need the base fee check.
+        uint256 _harvestCostMultiple = harvestCostMultiple;
+        bool gasAware = _harvestCostMultiple > 0;
+        if (
+            gasAware &&
+            claimableProfit * FEE_DENOMINATOR >
+            ethToUsdc(callCostinEth) * _harvestCostMultiple
+        ) {
+            return true;
+        }
+
         // check if the base fee gas price is higher than we allow. if it is, block harvests.
         if (!isBaseFeeAcceptable()) {
             return false;
@@ -644,7 +1520,7 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         }
 
         // harvest if we have a sufficient profit to claim, but only if our gas price is acceptable
-        if (claimableProfit > harvestProfitMinInUsdc) {
+        if (!gasAware && claimableProfit > harvestProfitMinInUsdc) {
             return true;
         }
 
@@ -663,21 +1539,74 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         return false;
     }
 
+    /**
+     * @notice
+     *  Provide a signal to the keeper that tend() should be called.
+     *
+     *  Tending only stakes our loose want in the gauge, without claiming or
+     *  selling rewards or reporting to the vault, so new deposits start
+     *  earning before our next harvest. Only tend if we have at least
+     *  tendThreshold want to stake above our buffer and our gas price
+     *  is acceptable.
+     *
+     * @param callCostinEth The keeper's estimated gas cost to call tend() (in wei).
+     * @return True if tend() should be called, false otherwise.
+     */
+    function tendTrigger(
+        uint256 callCostinEth
+    ) public view override returns (bool) {
+        uint256 _tendThreshold = tendThreshold;
+        if (_tendThreshold == 0 || emergencyExit) {
+            return false;
+        }
+
+        if (_wantToInvest() < _tendThreshold) {
+            return false;
+        }
+
+        return isBaseFeeAcceptable();
+    }
+
     /// @notice Calculates the profit if all claimable VELO were sold for USDC (6 decimals).
-    /// @dev Calls Velodrome's VELO-USDC pool directly.
+    /// @dev Calls our VELO-USDC price pool directly.
     /// @return Total return in USDC from selling claimable VELO.
     function claimableProfitInUsdc() public view returns (uint256) {
-        // check price on our VELOv2/USDC pool
-        uint256 veloPrice = IVelodromePool(
-            0x2223F9FE624F69Da4D8256A7bCc9104FBA7F8f75
-        ).getAmountOut(1e18, address(velo));
+        uint256 veloPrice = veloPriceInUsdc();
 
         // Pool returns amount as 6 decimals, so multiply by claimable VELO and divide by VELO decimals (1e18)
         return (veloPrice * claimableRewards()) / 1e18;
     }
 
+    /// @notice Price of 1 VELO in USDC (6 decimals).
+    /// @dev Uses the average of our pool's last priceTwapPoints observations if set, otherwise the spot price.
+    /// @return Value of 1 VELO in USDC.
+    function veloPriceInUsdc() public view returns (uint256) {
+        address pool = veloPricePool;
+        uint256 twapPoints = priceTwapPoints;
+        if (pool == address(0)) {
+            pool = DEFAULT_VELO_PRICE_POOL;
+        }
+
+        // a TWAP is much harder to manipulate, but lags the market a bit
+        if (twapPoints > 0) {
+            return IVelodromePool(pool).quote(address(velo), 1e18, twapPoints);
+        }
+        return IVelodromePool(pool).getAmountOut(1e18, address(velo));
+    }
+
+    /// @notice Convert an amount of ether into USDC (6 decimals) using our ethPricePool.
+    /// @dev Used in harvestTrigger to compare our keeper's call cost with our claimable profit.
+    /// @param _ethAmount Amount of ether.
+    /// @return Value of ether in USDC.
+    function ethToUsdc(uint256 _ethAmount) public view returns (uint256) {
+        if (_ethAmount == 0) {
+            return 0;
+        }
+        return IVelodromePool(ethPricePool).getAmountOut(_ethAmount, weth);
+    }
+
     /// @notice Convert our keeper's eth cost into want
-    /// @dev We don't use this since we don't factor call cost into our harvestTrigger.
+    /// @dev We don't use this since we compare call cost to our profit in USDC instead, see ethToUsdc.
     /// @param _ethAmount Amount of ether spent.
     /// @return Value of ether in want.
     function ethToWant(
@@ -703,6 +1632,97 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
     }
 
+    /**
+     * @notice
+     *  Here we set up our harvestTrigger to weigh claimable profit against our keeper's call cost.
+     * @dev While this is on, harvestProfitMinInUsdc is ignored, so a callCostinEth of zero
+     *  triggers a harvest on any claimable profit.
+     * @param _harvestCostMultiple Multiple of our call cost (out of 10,000) our profit must
+     *  exceed to harvest, ie 20,000 for 2x. Set to zero to go back to our fixed USDC thresholds.
+     * @param _ethPricePool WETH/USDC pool to use to convert our call cost to USDC.
+     */
+    function setGasAwareTriggerParams(
+        uint256 _harvestCostMultiple,
+        address _ethPricePool
+    ) external onlyVaultManagers {
+        if (_harvestCostMultiple > 0 && _ethPricePool == address(0)) {
+            revert("need price pool");
+        }
+
+        // any other pool would give us a meaningless price for our call cost
+        if (_ethPricePool != address(0)) {
+            address token0 = IVelodromePool(_ethPricePool).token0();
+            address token1 = IVelodromePool(_ethPricePool).token1();
+            if (
+                !((token0 == weth && token1 == usdc) ||
+                    (token0 == usdc && token1 == weth))
+            ) {
+                revert("not WETH/USDC pool");
+            }
+        }
+        harvestCostMultiple = _harvestCostMultiple;
+        ethPricePool = _ethPricePool;
+    }
+
+    /**
+     * @notice
+     *  Here we set where we get our VELO price for claimableProfitInUsdc.
+     * @dev Must be called by gov, management, or our factory.
+     * @param _veloPricePool VELO/USDC pool to price our rewards, zero address for our default pool.
+     * @param _priceTwapPoints Number of pool observations to average, zero for the spot price.
+     */
+    function setPriceSource(
+        address _veloPricePool,
+        uint256 _priceTwapPoints
+    ) external onlyVaultManagersOrFactory {
+        _setPriceSource(_veloPricePool, _priceTwapPoints);
+    }
+
+    // set and check our VELO price source
+    function _setPriceSource(
+        address _veloPricePool,
+        uint256 _priceTwapPoints
+    ) internal {
+        if (_priceTwapPoints > type(uint96).max) {
+            revert();
+        }
+        veloPricePool = _veloPricePool;
+        priceTwapPoints = uint96(_priceTwapPoints);
+
+        // make sure our new source actually works, the pool will revert if we ask for too many points
+        if (veloPriceInUsdc() == 0) {
+            revert("bad price source");
+        }
+    }
+
+    /// @notice Use this to set how much want we keep unstaked for withdrawals.
+    /// @dev Must be called by gov or management. Withdrawals smaller than our buffer skip the gauge.
+    /// @param _wantBufferBps Share of our total assets to keep loose (out of 10,000).
+    function setWantBuffer(uint256 _wantBufferBps) external onlyVaultManagers {
+        if (_wantBufferBps > 10_000) {
+            revert();
+        }
+        wantBufferBps = _wantBufferBps;
+    }
+
+    /// @notice Use this to set the minimum loose want our keeper will stake with a tend.
+    /// @dev Must be called by gov or management. Zero turns off tends.
+    /// @param _tendThreshold Minimum amount of want to trigger a tend.
+    function setTendThreshold(
+        uint256 _tendThreshold
+    ) external onlyVaultManagers {
+        tendThreshold = _tendThreshold;
+    }
+
+    /// @notice Use this to turn rebalancing of leftover token0/token1 during harvests on or off.
+    /// @dev Must be called by gov or management.
+    /// @param _rebalanceLeftovers Set to true to swap and deposit leftovers each harvest.
+    function setRebalanceLeftovers(
+        bool _rebalanceLeftovers
+    ) external onlyVaultManagers {
+        rebalanceLeftovers = _rebalanceLeftovers;
+    }
+
     /// @notice Here we can override the swap routes set on deployment.
     /// @dev Must be called by gov or management.
     /// @param _newSwapRouteForToken0 Swap route for VELO -> token0, using Routes structs.
@@ -713,38 +1733,207 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
         IVelodromeRouter.Routes[] memory _newSwapRouteForToken1,
         bool _isFeeOnTransfer
     ) external onlyVaultManagers {
-        delete swapRouteForToken0;
-        delete swapRouteForToken1;
+        delete packedRouteForToken0;
+        delete packedRouteForToken1;
+        delete routeFactories;
         isFeeOnTransfer = _isFeeOnTransfer;
 
-        for (uint i; i < _newSwapRouteForToken0.length; ++i) {
-            swapRouteForToken0.push(_newSwapRouteForToken0[i]);
-        }
-
-        for (uint i; i < _newSwapRouteForToken1.length; ++i) {
-            swapRouteForToken1.push(_newSwapRouteForToken1[i]);
-        }
+        _setSwapRoutes(_newSwapRouteForToken0, _newSwapRouteForToken1);
+    }
 
-        // check our swap paths end with our correct token, but only if it's not VELO
+    // pack and store both of our routes, reverting if either doesn't go from VELO to its pool token
+    function _setSwapRoutes(
+        IVelodromeRouter.Routes[] memory _swapRouteForToken0,
+        IVelodromeRouter.Routes[] memory _swapRouteForToken1
+    ) internal {
         if (
-            address(poolToken0) != address(velo) &&
-            address(poolToken0) !=
-            swapRouteForToken0[_newSwapRouteForToken0.length - 1].to
+            !_packRoute(
+                _swapRouteForToken0,
+                address(poolToken0()),
+                packedRouteForToken0
+            )
         ) {
             revert("token0 route error");
         }
 
         if (
-            address(poolToken1) != address(velo) &&
-            address(poolToken1) !=
-            swapRouteForToken1[_newSwapRouteForToken1.length - 1].to
+            !_packRoute(
+                _swapRouteForToken1,
+                address(poolToken1()),
+                packedRouteForToken1
+            )
         ) {
             revert("token1 route error");
         }
     }
 
+    // pack a route into storage, returns false if it doesn't go hop by hop from VELO to our token
+    function _packRoute(
+        IVelodromeRouter.Routes[] memory _route,
+        address _token,
+        uint256[] storage _packedRoute
+    ) internal returns (bool) {
+        // we never swap VELO for itself, so no need to store a route
+        if (_token == address(velo)) {
+            return true;
+        }
+
+        address poolFactory = factory();
+        address from = address(velo);
+        for (uint256 i; i < _route.length; ++i) {
+            IVelodromeRouter.Routes memory hop = _route[i];
+            if (hop.from != from) {
+                return false;
+            }
+
+            uint256 packedHop = uint256(uint160(hop.to)) |
+                (_routeFactoryIndex(hop.factory, poolFactory) <<
+                    ROUTE_FACTORY_SHIFT);
+            if (hop.stable) {
+                packedHop |= 1 << ROUTE_STABLE_BIT;
+            }
+            _packedRoute.push(packedHop);
+            from = hop.to;
+        }
+
+        return from == _token;
+    }
+
+    // index of a factory in our packed routes, adding it to routeFactories if needed
+    function _routeFactoryIndex(
+        address _factory,
+        address _poolFactory
+    ) internal returns (uint256) {
+        // most routes use our pool's factory, so don't store it
+        if (_factory == _poolFactory) {
+            return 0;
+        }
+
+        uint256 numFactories = routeFactories.length;
+        for (uint256 i; i < numFactories; ++i) {
+            if (routeFactories[i] == _factory) {
+                return i + 1;
+            }
+        }
+
+        if (numFactories == type(uint8).max) {
+            revert("too many factories");
+        }
+        routeFactories.push(_factory);
+        return numFactories + 1;
+    }
+
+    /// @notice Our factory uses this to push its current config to this strategy.
+    /// @dev Must be called by our factory. Same checks as our individual setters.
+    /// @param _healthCheck Address of our health check contract.
+    /// @param _baseFeeOracle Address of our base fee oracle.
+    /// @param _keepVelo Percent of each VELO harvest to send to our voter.
+    /// @param _harvestProfitMinInUsdc Profit (USDC, 6 decimals) that triggers a harvest if gas price is acceptable.
+    /// @param _harvestProfitMaxInUsdc Profit (USDC, 6 decimals) that triggers a harvest regardless of gas price.
+    /// @param _veloPricePool VELO/USDC pool to price our rewards, zero address for our default pool.
+    /// @param _priceTwapPoints Number of pool observations to average, zero for the spot price.
+    function setFactoryConfig(
+        address _healthCheck,
+        address _baseFeeOracle,
+        uint256 _keepVelo,
+        uint256 _harvestProfitMinInUsdc,
+        uint256 _harvestProfitMaxInUsdc,
+        address _veloPricePool,
+        uint256 _priceTwapPoints
+    ) external {
+        if (msg.sender != vaultFactory) {
+            revert();
+        }
+        if (_keepVelo > 10_000) {
+            revert();
+        }
+        if (_keepVelo > 0 && address(stakingRewardsMulti) == address(0)) {
+            revert();
+        }
+
+        healthCheck = _healthCheck;
+        baseFeeOracle = _baseFeeOracle;
+        localKeepVELO = _keepVelo;
+        harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
+        harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
+        _setPriceSource(_veloPricePool, _priceTwapPoints);
+
+        // don't leave any keepVELO sitting here if we're not adding to it anymore
+        if (_keepVelo == 0) {
+            _notifyPendingKeepVELO();
+        }
+    }
+
+    /// @notice Our factory uses this to carry over per-strategy settings from the strategy we're replacing.
+    /// @dev Must be called by our factory. Works with strategies from older implementations too; any setting
+    ///  they don't have keeps our default. These are intentionally not carried over: health check, base fee
+    ///  oracle, strategist and rewards come from our factory's current config, doHealthCheck stays at its
+    ///  default, and routes are set on deploy. Any pendingKeepVELO is sent out by the old strategy when it
+    ///  migrates.
+    /// @param _oldStrategy Strategy to copy settings from.
+    function copySettingsFrom(address _oldStrategy) external {
+        if (msg.sender != vaultFactory) {
+            revert();
+        }
+        StrategyVelodromeMultiRewards oldStrategy = StrategyVelodromeMultiRewards(
+            _oldStrategy
+        );
+
+        // keeper and reporting
+        keeper = oldStrategy.keeper();
+        minReportDelay = oldStrategy.minReportDelay();
+        maxReportDelay = oldStrategy.maxReportDelay();
+        creditThreshold = oldStrategy.creditThreshold();
+
+        // harvest and tend triggers
+        harvestProfitMinInUsdc = oldStrategy.harvestProfitMinInUsdc();
+        harvestProfitMaxInUsdc = oldStrategy.harvestProfitMaxInUsdc();
+        try oldStrategy.harvestCostMultiple() returns (
+            uint256 _harvestCostMultiple
+        ) {
+            harvestCostMultiple = _harvestCostMultiple;
+            ethPricePool = oldStrategy.ethPricePool();
+        } catch {}
+        try oldStrategy.tendThreshold() returns (uint256 _tendThreshold) {
+            tendThreshold = _tendThreshold;
+        } catch {}
+        try oldStrategy.veloPricePool() returns (address _veloPricePool) {
+            _setPriceSource(_veloPricePool, oldStrategy.priceTwapPoints());
+        } catch {}
+
+        // keepVELO goes to the same contract as before, or nowhere until governance sets one again
+        _setStakingRewardsMulti(address(oldStrategy.stakingRewardsMulti()));
+        if (address(stakingRewardsMulti) != address(0)) {
+            localKeepVELO = oldStrategy.localKeepVELO();
+        } else {
+            localKeepVELO = 0;
+        }
+        try oldStrategy.minKeepVELOToNotify() returns (
+            uint256 _minKeepVELOToNotify
+        ) {
+            minKeepVELOToNotify = _minKeepVELOToNotify;
+        } catch {}
+
+        // swaps and deposits
+        isFeeOnTransfer = oldStrategy.isFeeOnTransfer();
+        try oldStrategy.rebalanceLeftovers() returns (bool _rebalanceLeftovers) {
+            rebalanceLeftovers = _rebalanceLeftovers;
+        } catch {}
+        try oldStrategy.wantBufferBps() returns (uint256 _wantBufferBps) {
+            wantBufferBps = _wantBufferBps;
+        } catch {}
+    }
+
+    /// @notice Use this to set the factory allowed to push factory-wide settings to this strategy.
+    /// @dev Only governance can set this, zero address to remove our factory's access.
+    /// @param _vaultFactory Address of our factory.
+    function setVaultFactory(address _vaultFactory) external onlyGovernance {
+        vaultFactory = _vaultFactory;
+    }
+
     /// @notice Use this to set or update our keep amounts for this strategy.
     /// @dev Must be less than 10,000. Set in basis points. Only governance can set this.
+    ///  Setting this to zero sends out any pendingKeepVELO.
     /// @param _keepVelo Percent of each VELO harvest to send to our voter.
     function setLocalKeepVelo(uint256 _keepVelo) external onlyGovernance {
         if (_keepVelo > 10_000) {
@@ -754,13 +1943,47 @@ contract StrategyVelodromeMultiRewards is BaseStrategy {
             revert();
         }
         localKeepVELO = _keepVelo;
+
+        // don't leave any keepVELO sitting here if we're not adding to it anymore
+        if (_keepVelo == 0) {
+            _notifyPendingKeepVELO();
+        }
+    }
+
+    /// @notice Use this to set the minimum keepVELO we hold before sending it to our StakingRewardsMulti contract.
+    /// @dev Only governance can set this. Batching saves us an expensive notify on most harvests.
+    ///  If we're already holding at least the new minimum, it is sent right away.
+    /// @param _minKeepVELOToNotify Minimum pendingKeepVELO to notify with.
+    function setMinKeepVELOToNotify(
+        uint256 _minKeepVELOToNotify
+    ) external onlyGovernance {
+        minKeepVELOToNotify = _minKeepVELOToNotify;
+        if (pendingKeepVELO >= _minKeepVELOToNotify) {
+            _notifyPendingKeepVELO();
+        }
     }
 
     /// @notice Use this to set or update our StakingRewardsMulti contract.
     /// @dev For Velo strategies, this is where we send our keepVELO.
-    ///  Only governance can set this.
+    ///  Only governance can set this. Any pendingKeepVELO is sent to our old contract first.
     /// @param _stakingRewardsMulti Address of our StakingRewardsMulti contract.
     function setStakingRewardsMulti(address _stakingRewardsMulti) external onlyGovernance {
+        _notifyPendingKeepVELO();
+        _setStakingRewardsMulti(_stakingRewardsMulti);
+    }
+
+    // swap our StakingRewardsMulti contract, which pulls VELO from us when notified, moving our approval with it
+    function _setStakingRewardsMulti(address _stakingRewardsMulti) internal {
+        address oldStakingRewardsMulti = address(stakingRewardsMulti);
+        if (oldStakingRewardsMulti == _stakingRewardsMulti) {
+            return;
+        }
+        if (oldStakingRewardsMulti != address(0)) {
+            velo.approve(oldStakingRewardsMulti, 0);
+        }
         stakingRewardsMulti = IStakingRewardsMulti(_stakingRewardsMulti);
+        if (_stakingRewardsMulti != address(0)) {
+            velo.approve(_stakingRewardsMulti, type(uint256).max);
+        }
     }
 }
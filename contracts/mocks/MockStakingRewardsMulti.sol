@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+import "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+
+/// @notice Bare-bones StakingRewardsMulti for testing, only pulls in the rewards it's notified of.
+/// @dev Like the real contract, rewards are transferred from the caller, so it must be approved first.
+contract MockStakingRewardsMulti {
+    using SafeERC20 for IERC20;
+
+    event RewardAdded(address indexed rewardToken, uint256 reward);
+
+    function notifyRewardAmount(
+        address _rewardsToken,
+        uint256 _reward
+    ) external {
+        IERC20(_rewardsToken).safeTransferFrom(
+            msg.sender,
+            address(this),
+            _reward
+        );
+        emit RewardAdded(_rewardsToken, _reward);
+    }
+}
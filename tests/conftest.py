@@ -115,10 +115,10 @@ def strategy_name():
 # this is the name of our strategy in the .sol file
 @pytest.fixture(scope="session")
 def contract_name(
-    StrategyVelodromeFactoryClonable,
+    StrategyVelodromeMultiRewards,
     which_strategy,
 ):
-    contract_name = StrategyVelodromeFactoryClonable
+    contract_name = StrategyVelodromeMultiRewards
     yield contract_name
 
 
@@ -316,10 +316,10 @@ elif chain_used == 8453:  # base
     def to_sweep_whale():
         yield accounts.at("0xeBf418Fe2512e7E6bd9b87a8F0f294aCDC67e6B4", force=True)
 
-
-#     @pytest.fixture(scope="session")
-#     def keeper_wrapper(KeeperWrapper):
-#         yield KeeperWrapper.at("0x9Ce0115381f009E382acd52761127eFF61061482")
+    # no keeper wrapper deployed on base yet, so deploy a fresh one
+    @pytest.fixture(scope="function")
+    def keeper_wrapper(KeeperWrapper, gov):
+        yield gov.deploy(KeeperWrapper)
 
 
 @pytest.fixture(scope="function")
@@ -380,6 +380,7 @@ def strategy(
         contract_name,
         vault,
         gauge,
+        ZERO_ADDRESS,
         route0,
         route1,
     )
@@ -443,6 +444,12 @@ def route1(pham, usdc, pwblt, to_sweep, v2_pool_factory, v1_pool_factory):
     yield route1
 
 
+# aerodrome WETH/USDC volatile pool, used to price keeper call costs
+@pytest.fixture(scope="session")
+def eth_price_pool():
+    yield "0xcDAC0d6c6C59727a65F871236188350531885C43"
+
+
 @pytest.fixture(scope="session")
 def usdbc():
     yield "0xd9aAEc86B65D86f6A7B5B1b0c42FFA531710b6CA"
@@ -532,7 +539,7 @@ def random_route_2(usdbc, usdc, to_sweep, v2_pool_factory, v1_pool_factory):
 
 @pytest.fixture(scope="function")
 def velo_template(
-    StrategyVelodromeFactoryClonable,
+    StrategyVelodromeMultiRewards,
     template_vault,
     strategist,
     template_gauge,
@@ -542,9 +549,10 @@ def velo_template(
 ):
     # deploy our curve template
     velo_template = gov.deploy(
-        StrategyVelodromeFactoryClonable,
+        StrategyVelodromeMultiRewards,
         template_vault,
         template_gauge,
+        ZERO_ADDRESS,
         template_route0,
         template_route1,
     )
@@ -556,14 +564,14 @@ def velo_template(
 
 @pytest.fixture(scope="function")
 def velo_global(
-    VelodromeGlobal,
+    AerodromeGlobal,
     new_registry,
     gov,
     velo_template,
 ):
     # deploy our factory
     velo_global = gov.deploy(
-        VelodromeGlobal,
+        AerodromeGlobal,
         new_registry,
         velo_template,
         gov,
@@ -573,6 +581,17 @@ def velo_global(
     yield velo_global
 
 
+@pytest.fixture(scope="function")
+def aerodrome_lens(AerodromeLens, gov):
+    yield gov.deploy(AerodromeLens)
+
+
+# stands in for a StakingRewardsMulti contract to receive our keepVELO
+@pytest.fixture(scope="function")
+def staking_rewards_multi(MockStakingRewardsMulti, gov):
+    yield gov.deploy(MockStakingRewardsMulti)
+
+
 @pytest.fixture(scope="session")
 def new_registry():
     yield Contract("0xF3885eDe00171997BFadAa98E01E167B53a78Ec5")
@@ -699,6 +718,7 @@ def stable_strategy(
         contract_name,
         vault,
         stable_gauge,
+        ZERO_ADDRESS,
         stable_route0,
         stable_route1,
     )
@@ -840,6 +860,7 @@ def velo_strategy(
         contract_name,
         vault,
         velo_gauge,
+        ZERO_ADDRESS,
         velo_route0,
         velo_route1,
     )
@@ -1,11 +1,11 @@
 import brownie
-from brownie import Contract, ZERO_ADDRESS, interface, chain, accounts
+from brownie import Contract, ZERO_ADDRESS, interface, chain, accounts, web3
 import math
 import pytest
 
 
 def test_vault_deployment(
-    StrategyVelodromeFactoryClonable,
+    StrategyVelodromeMultiRewards,
     strategist,
     velo_global,
     gov,
@@ -46,6 +46,9 @@ def test_vault_deployment(
         "Set our global keeps, don't mess with curve voter or we will revert on deploy"
     )
 
+    # we should know our strategy address before we deploy
+    predicted_strategy = velo_global.predictStrategyAddress(gauge)
+
     tx = velo_global.createNewVaultsAndStrategies(
         gauge, route0, route1, {"from": whale}
     )
@@ -72,7 +75,11 @@ def test_vault_deployment(
 
     # check that things are good on our strategies
     velo_strat = tx.events["NewAutomatedVault"]["velodromeStrategy"]
-    velo_strategy = StrategyVelodromeFactoryClonable.at(velo_strat)
+    assert velo_global.gaugeToVault(gauge) == vault_address
+    assert velo_global.gaugeToStrategy(gauge) == velo_strat
+    assert velo_global.lpTokenToVault(token) == vault_address
+    assert velo_strat == predicted_strategy
+    velo_strategy = StrategyVelodromeMultiRewards.at(velo_strat)
     assert vault.withdrawalQueue(0) == velo_strat
     assert vault.strategies(velo_strat)["performanceFee"] == 0
     assert velo_strategy.creditThreshold() == 5e22
@@ -83,10 +90,33 @@ def test_vault_deployment(
     assert velo_strategy.strategist() == velo_global.management()
     assert velo_strategy.keeper() == velo_global.keeper()
 
+    assert velo_strategy.vaultFactory() == velo_global.address
+
     # daddy needs to accept gov on all new vaults
     vault.acceptGovernance({"from": gov})
     assert vault.governance() == gov.address
 
+    # our factory can still push its config, including our price source, after handing off gov
+    assert velo_strategy.harvestProfitMinInUsdc() == velo_global.harvestProfitMinInUsdc()
+    velo_global.setHarvestProfitMinInUsdc(2_000e6, {"from": gov})
+    velo_global.setPriceSource(ZERO_ADDRESS, 4, {"from": gov})
+    tx = velo_global.pushConfigToStrategies(0, 2**256 - 1, {"from": gov})
+    assert tx.return_value == velo_global.numVaults()
+    assert tx.events["StrategyConfigPushed"]["strategy"] == velo_strategy.address
+    assert tx.events["StrategyConfigPushed"]["success"] == True
+    assert velo_strategy.harvestProfitMinInUsdc() == 2_000e6
+    assert velo_strategy.priceTwapPoints() == 4
+    assert velo_strategy.veloPriceInUsdc() > 0
+    with brownie.reverts():
+        velo_global.pushConfigToStrategies(0, 1, {"from": whale})
+
+    # if governance removes our access, we report it and move on
+    velo_strategy.setVaultFactory(ZERO_ADDRESS, {"from": gov})
+    tx = velo_global.pushConfigToStrategies(0, 2**256 - 1, {"from": gov})
+    assert tx.return_value == velo_global.numVaults()
+    assert tx.events["StrategyConfigPushed"]["success"] == False
+    velo_strategy.setVaultFactory(velo_global, {"from": gov})
+
     # check that anyone can harvest a strategy thanks to our keeper wrapper
     print(
         "Check out our keeper wrapper, make sure it works as intended for all strategies"
@@ -129,7 +159,7 @@ def test_vault_deployment(
 
 
 def test_permissioned_vault(
-    StrategyVelodromeFactoryClonable,
+    StrategyVelodromeMultiRewards,
     strategist,
     velo_global,
     gov,
@@ -219,7 +249,7 @@ def test_permissioned_vault(
 
     # check that things are good on our strategies
     velo_strat = tx.events["NewAutomatedVault"]["velodromeStrategy"]
-    velo_strategy = StrategyVelodromeFactoryClonable.at(velo_strat)
+    velo_strategy = StrategyVelodromeMultiRewards.at(velo_strat)
     assert vault.withdrawalQueue(0) == velo_strat
     assert vault.strategies(velo_strat)["performanceFee"] == 0
     assert velo_strategy.creditThreshold() == 5e22
@@ -266,6 +296,13 @@ def test_velo_global_setters_and_views(
     length = velo_global.numVaults()
     print("Number of vaults:", length)
 
+    # check our paginated views line up with the full list
+    assert velo_global.deployedVaultsPaginated(0, length) == all_vaults
+    assert velo_global.deployedVaultsPaginated(0, 2**256 - 1) == all_vaults
+    assert velo_global.deployedVaultsPaginated(length, 10) == []
+    assert velo_global.deployedVaultsSince(0) == all_vaults
+    assert velo_global.deployedVaultsSince(length) == []
+
     # this one should always be yes (BLU/USDC) as we will almost certainly never make a vault for this
     assert velo_global.canCreateVaultPermissionlessly(
         "0x8166f06D50a65F82850878c951fcA29Af5Ea7Db2"
@@ -372,6 +409,32 @@ def test_velo_global_setters_and_views(
     with brownie.reverts():
         velo_global.setPerformanceFee(9999, {"from": gov})
 
+    # our config view should match all of our individual views
+    config = velo_global.factoryConfig()
+    assert config["registry"] == velo_global.registry()
+    assert config["governance"] == velo_global.governance()
+    assert config["management"] == velo_global.management()
+    assert config["guardian"] == velo_global.guardian()
+    assert config["treasury"] == velo_global.treasury()
+    assert config["keeper"] == velo_global.keeper()
+    assert config["healthCheck"] == velo_global.healthCheck()
+    assert config["baseFeeOracle"] == velo_global.baseFeeOracle()
+    assert config["veloVoter"] == velo_global.veloVoter()
+    assert config["keepVELO"] == velo_global.keepVELO()
+    assert config["performanceFee"] == 69
+    assert config["managementFee"] == 69
+    assert config["depositLimit"] == 69
+    assert config["harvestProfitMinInUsdc"] == 69
+    assert config["harvestProfitMaxInUsdc"] == 69
+
+    # packed values can't overflow
+    with brownie.reverts():
+        velo_global.setDepositLimit(2**112, {"from": gov})
+    with brownie.reverts():
+        velo_global.setHarvestProfitMinInUsdc(2**48, {"from": gov})
+    with brownie.reverts():
+        velo_global.setHarvestProfitMaxInUsdc(2**48, {"from": gov})
+
     with brownie.reverts():
         velo_global.setOwner(gov, {"from": whale})
     velo_global.setOwner(whale, {"from": gov})
@@ -379,3 +442,265 @@ def test_velo_global_setters_and_views(
         velo_global.acceptOwner({"from": gov})
     velo_global.acceptOwner({"from": whale})
     assert velo_global.owner() == whale.address
+
+
+def test_lens(
+    velo_global,
+    aerodrome_lens,
+    new_registry,
+    gauge,
+    whale,
+    route0,
+    route1,
+):
+    # once our factory is deployed, setup the factory from gov
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(velo_global, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(velo_global, True, {"from": registry_owner})
+
+    # no vaults yet, so we should get nothing back
+    assert len(aerodrome_lens.vaultInfos(velo_global, 0)) == 0
+
+    tx = velo_global.createNewVaultsAndStrategies(
+        gauge, route0, route1, {"from": whale}
+    )
+    vault = tx.events["NewAutomatedVault"]["vault"]
+    velo_strat = tx.events["NewAutomatedVault"]["velodromeStrategy"]
+
+    infos = aerodrome_lens.vaultInfos(velo_global, 0)
+    assert len(infos) == 1
+    info = infos[0]
+    print("Vault info:", info)
+    assert info["vault"] == vault
+    assert info["strategy"] == velo_strat
+    assert info["estimatedTotalAssets"] == 0
+    assert info["params"]["debtRatio"] == 10_000
+    assert not info["assetsReverted"]
+    assert not info["paramsReverted"]
+
+    # ranges are capped at our number of vaults
+    assert len(aerodrome_lens.vaultInfosInRange(velo_global, 0, 100, 0)) == 1
+    assert len(aerodrome_lens.vaultInfosInRange(velo_global, 1, 100, 0)) == 0
+
+
+def test_permissioned_vault_batch(
+    velo_global,
+    gov,
+    whale,
+    new_registry,
+    gauge,
+    stable_gauge,
+    route0,
+    route1,
+    stable_route0,
+    stable_route1,
+    tests_using_tenderly,
+):
+    # once our factory is deployed, setup the factory from gov
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(velo_global, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(velo_global, True, {"from": registry_owner})
+
+    gauges = [gauge, stable_gauge]
+    routes0 = [route0, stable_route0]
+    routes1 = [route1, stable_route1]
+    names = ["stuff", "stable stuff"]
+    symbols = ["stuff", "stablestuff"]
+
+    if not tests_using_tenderly:
+        # only owner or management can create in batch
+        with brownie.reverts():
+            velo_global.createNewVaultsAndStrategiesPermissionedBatch(
+                gauges, routes0, routes1, names, symbols, {"from": whale}
+            )
+
+        # all of our arrays need to line up
+        with brownie.reverts("length mismatch"):
+            velo_global.createNewVaultsAndStrategiesPermissionedBatch(
+                gauges, routes0, routes1, names[:1], symbols, {"from": gov}
+            )
+
+    tx = velo_global.createNewVaultsAndStrategiesPermissionedBatch(
+        gauges, routes0, routes1, names, symbols, {"from": gov}
+    )
+    (vaults, strategies) = tx.return_value
+    assert len(tx.events["NewAutomatedVault"]) == 2
+    assert velo_global.numVaults() == 2
+
+    for i in range(2):
+        vault = Contract(vaults[i])
+        assert vault.name() == names[i]
+        assert vault.withdrawalQueue(0) == strategies[i]
+        assert velo_global.gaugeToVault(gauges[i]) == vaults[i]
+        assert velo_global.gaugeToStrategy(gauges[i]) == strategies[i]
+
+
+# make sure we can migrate our factory strategies in batch
+def test_migrate_strategies(
+    StrategyVelodromeMultiRewards,
+    velo_global,
+    gov,
+    whale,
+    new_registry,
+    token,
+    gauge,
+    route0,
+    route1,
+    amount,
+    staking_rewards_multi,
+):
+    # once our factory is deployed, setup the factory from gov
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(velo_global, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(velo_global, True, {"from": registry_owner})
+
+    tx = velo_global.createNewVaultsAndStrategies(
+        gauge, route0, route1, {"from": whale}
+    )
+    vault = Contract(tx.events["NewAutomatedVault"]["vault"])
+    old_strategy = StrategyVelodromeMultiRewards.at(
+        tx.events["NewAutomatedVault"]["velodromeStrategy"]
+    )
+
+    # deposit and harvest so we have funds to move
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    old_strategy.harvest({"from": gov})
+    old_assets = old_strategy.estimatedTotalAssets()
+    assert old_assets > 0
+
+    # tune our old strategy, these should all carry over
+    old_strategy.setKeeper(whale, {"from": gov})
+    old_strategy.setTendThreshold(123, {"from": gov})
+    old_strategy.setWantBuffer(500, {"from": gov})
+    old_strategy.setRebalanceLeftovers(True, {"from": gov})
+    old_strategy.setHarvestTriggerParams(5e6, 50e6, {"from": gov})
+    old_strategy.setMinKeepVELOToNotify(100e18, {"from": gov})
+    old_strategy.setCreditThreshold(1e18, {"from": gov})
+    old_strategy.setStakingRewardsMulti(staking_rewards_multi, {"from": gov})
+    old_strategy.setLocalKeepVelo(500, {"from": gov})
+
+    # only owner or management can migrate
+    with brownie.reverts():
+        velo_global.migrateStrategies([vault], {"from": whale})
+
+    tx = velo_global.migrateStrategies([vault], {"from": gov})
+    new_strategy = StrategyVelodromeMultiRewards.at(tx.return_value[0])
+    assert tx.events["StrategyMigrated"]["oldStrategy"] == old_strategy.address
+    assert vault.withdrawalQueue(0) == new_strategy.address
+    assert velo_global.gaugeToStrategy(gauge) == new_strategy.address
+    assert new_strategy.gauge() == old_strategy.gauge()
+    assert new_strategy.swapRoutes() == old_strategy.swapRoutes()
+    assert new_strategy.isFeeOnTransfer() == old_strategy.isFeeOnTransfer()
+    assert new_strategy.estimatedTotalAssets() == old_assets
+    assert old_strategy.estimatedTotalAssets() == 0
+
+    assert new_strategy.keeper() == whale.address
+    assert new_strategy.tendThreshold() == 123
+    assert new_strategy.wantBufferBps() == 500
+    assert new_strategy.rebalanceLeftovers()
+    assert new_strategy.harvestProfitMinInUsdc() == 5e6
+    assert new_strategy.harvestProfitMaxInUsdc() == 50e6
+    assert new_strategy.minKeepVELOToNotify() == 100e18
+    assert new_strategy.creditThreshold() == 1e18
+    assert new_strategy.maxReportDelay() == old_strategy.maxReportDelay()
+    assert new_strategy.vaultFactory() == velo_global.address
+    assert new_strategy.stakingRewardsMulti() == staking_rewards_multi.address
+    assert new_strategy.localKeepVELO() == 500
+
+    # once gov accepts the vault, we deploy a replacement and leave the migration to gov
+    vault.acceptGovernance({"from": gov})
+    old_strategy = new_strategy
+    tx = velo_global.migrateStrategies([vault], {"from": gov})
+    new_strategy = StrategyVelodromeMultiRewards.at(tx.return_value[0])
+    assert "StrategyMigrated" not in tx.events
+    assert tx.events["StrategyReplacementDeployed"]["vault"] == vault.address
+    assert tx.events["StrategyReplacementDeployed"]["newStrategy"] == new_strategy.address
+    assert vault.withdrawalQueue(0) == old_strategy.address
+    assert new_strategy.keeper() == whale.address
+
+    # our index only moves once the vault actually uses our replacement, and we don't deploy another until then
+    assert velo_global.gaugeToStrategy(gauge) == old_strategy.address
+    assert velo_global.pendingReplacement(vault) == new_strategy.address
+    tx = velo_global.migrateStrategies([vault], {"from": gov})
+    assert tx.return_value[0] == new_strategy.address
+
+    vault.migrateStrategy(old_strategy, new_strategy, {"from": gov})
+    assert vault.withdrawalQueue(0) == new_strategy.address
+    assert new_strategy.estimatedTotalAssets() == old_assets
+
+    # next time around we pick up governance's migration
+    tx = velo_global.migrateStrategies([vault], {"from": gov})
+    assert velo_global.gaugeToStrategy(gauge) == new_strategy.address
+    assert tx.return_value[0] != new_strategy.address
+
+
+def test_emergency_exit_vaults(
+    StrategyVelodromeMultiRewards,
+    velo_global,
+    gov,
+    whale,
+    new_registry,
+    token,
+    gauge,
+    route0,
+    route1,
+    amount,
+):
+    # once our factory is deployed, setup the factory from gov
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(velo_global, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(velo_global, True, {"from": registry_owner})
+
+    tx = velo_global.createNewVaultsAndStrategies(
+        gauge, route0, route1, {"from": whale}
+    )
+    vault = Contract(tx.events["NewAutomatedVault"]["vault"])
+    strategy = StrategyVelodromeMultiRewards.at(
+        tx.events["NewAutomatedVault"]["velodromeStrategy"]
+    )
+    vault.acceptGovernance({"from": gov})
+
+    # deposit and harvest so we're staked
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    strategy.harvest({"from": gov})
+    staked = strategy.stakedBalance()
+    assert staked > 0
+
+    # only owner, management or guardian can do this
+    with brownie.reverts():
+        velo_global.emergencyExitVaults(0, 2**256 - 1, {"from": whale})
+
+    # if our gauge is broken, we still exit and get revoked
+    gauge_code = web3.eth.get_code(gauge.address)
+    web3.provider.make_request("anvil_setCode", [gauge.address, "0x60006000fd"])
+    guardian = accounts.at(velo_global.guardian(), force=True)
+    tx = velo_global.emergencyExitVaults(0, 2**256 - 1, {"from": guardian})
+    assert tx.return_value == velo_global.numVaults()
+    assert tx.events["StrategyEmergencyExit"]["exited"] == True
+    assert tx.events["StrategyEmergencyExit"]["unstaked"] == False
+    assert strategy.emergencyExit()
+    assert vault.strategies(strategy)["debtRatio"] == 0
+
+    # once our gauge works again, we can pull our funds
+    web3.provider.make_request("anvil_setCode", [gauge.address, web3.toHex(gauge_code)])
+
+    # we don't start on a strategy we can't give its full gas, so our cursor doesn't skip it
+    tx = velo_global.emergencyExitStrategies(
+        [strategy], {"from": guardian, "gas_limit": 500_000}
+    )
+    assert tx.return_value == 0
+    assert "StrategyEmergencyExit" not in tx.events
+    assert strategy.stakedBalance() == staked
+
+    tx = velo_global.emergencyExitStrategies([strategy], {"from": guardian})
+    assert tx.return_value == 1
+    assert tx.events["StrategyEmergencyExit"]["unstaked"] == True
+    assert strategy.stakedBalance() == 0
+    assert strategy.balanceOfWant() == staked
+
+    # running it again is harmless, and our next harvest sends everything back to the vault
+    velo_global.emergencyExitStrategies([strategy], {"from": guardian})
+    strategy.harvest({"from": gov})
+    assert strategy.estimatedTotalAssets() == 0
@@ -1,5 +1,5 @@
 import brownie
-from brownie import chain
+from brownie import chain, web3, ZERO_ADDRESS
 import pytest
 from utils import harvest_strategy
 
@@ -59,6 +59,7 @@ def test_cloning(
             rewards,
             keeper,
             gauge,
+            ZERO_ADDRESS,
             route0,
             route1,
             {"from": gov},
@@ -73,8 +74,10 @@ def test_cloning(
                 rewards,
                 keeper,
                 gauge,
+                ZERO_ADDRESS,
                 route0,
                 route1,
+                gov,
                 {"from": gov},
             )
 
@@ -84,6 +87,7 @@ def test_cloning(
             rewards,
             keeper,
             gauge,
+            ZERO_ADDRESS,
             route0,
             route1,
             {"from": gov},
@@ -99,8 +103,10 @@ def test_cloning(
                 rewards,
                 keeper,
                 gauge,
+                ZERO_ADDRESS,
                 route0,
                 route1,
+                gov,
                 {"from": gov},
             )
 
@@ -112,6 +118,7 @@ def test_cloning(
                 rewards,
                 keeper,
                 gauge,
+                ZERO_ADDRESS,
                 route0,
                 route1,
                 {"from": gov},
@@ -207,3 +214,102 @@ def test_cloning(
 
     # make sure our PPS went us as well
     assert vault.pricePerShare() >= before_pps
+
+
+# make sure clones with our pool info in their bytecode read the same values as a normal strategy
+def test_cloning_with_immutable_args(
+    gov,
+    token,
+    vault,
+    strategist,
+    whale,
+    strategy,
+    rewards,
+    keeper,
+    amount,
+    contract_name,
+    is_clonable,
+    tests_using_tenderly,
+    profit_whale,
+    profit_amount,
+    target,
+    use_yswaps,
+    gauge,
+    route0,
+    route1,
+):
+    # skip this test if we don't clone
+    if not is_clonable:
+        return
+
+    tx = strategy.cloneStrategyVelodromeWithImmutableArgs(
+        vault,
+        strategist,
+        rewards,
+        keeper,
+        gauge,
+        ZERO_ADDRESS,
+        route0,
+        route1,
+        {"from": gov},
+    )
+    new_strategy = contract_name.at(tx.return_value)
+
+    # our clone is the EIP-1167 runtime (45 bytes) plus 81 bytes of pool info
+    assert len(web3.eth.get_code(new_strategy.address)) == 126
+    assert new_strategy.gauge() == strategy.gauge()
+    assert new_strategy.poolToken0() == strategy.poolToken0()
+    assert new_strategy.poolToken1() == strategy.poolToken1()
+    assert new_strategy.factory() == strategy.factory()
+    assert new_strategy.isStablePool() == strategy.isStablePool()
+    assert new_strategy.isOriginal() == False
+    assert new_strategy.vaultFactory() == gov.address
+
+    if not tests_using_tenderly:
+        # Shouldn't be able to call initialize again
+        with brownie.reverts():
+            new_strategy.initialize(
+                vault,
+                strategist,
+                rewards,
+                keeper,
+                gauge,
+                ZERO_ADDRESS,
+                route0,
+                route1,
+                gov,
+                {"from": gov},
+            )
+
+        ## shouldn't be able to clone a clone
+        with brownie.reverts():
+            new_strategy.cloneStrategyVelodromeWithImmutableArgs(
+                vault,
+                strategist,
+                rewards,
+                keeper,
+                gauge,
+                ZERO_ADDRESS,
+                route0,
+                route1,
+                {"from": gov},
+            )
+
+    # swap our new strategy in for the old one
+    vault.updateStrategyDebtRatio(strategy, 0, {"from": gov})
+    vault.addStrategy(new_strategy.address, 10_000, 0, 2**256 - 1, 0, {"from": gov})
+
+    # deposit and harvest, make sure funds end up in the gauge
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    (profit, loss, extra) = harvest_strategy(
+        use_yswaps,
+        new_strategy,
+        token,
+        gov,
+        profit_whale,
+        profit_amount,
+        target,
+    )
+    assert new_strategy.stakedBalance() > 0
+    assert token.balanceOf(new_strategy) == 0
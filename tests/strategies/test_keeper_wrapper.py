@@ -0,0 +1,118 @@
+import brownie
+from brownie import chain, ZERO_ADDRESS
+import pytest
+
+
+# make sure our keeper wrapper can harvest a batch of strategies, skipping any that revert
+def test_harvest_many(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    keeper_wrapper,
+):
+    ## deposit to the vault after approving
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+
+    # our wrapper needs to be the keeper to harvest
+    strategy.setKeeper(keeper_wrapper, {"from": gov})
+    chain.sleep(1)
+    chain.mine()
+
+    # include an address with no code, as well as our whale, and they should be skipped
+    tx = keeper_wrapper.harvestMany(
+        [ZERO_ADDRESS, strategy, whale.address], {"from": whale}
+    )
+    results = tx.events["HarvestResult"]
+    assert len(results) == 3
+    assert results[0]["strategy"] == ZERO_ADDRESS
+    assert results[0]["success"] == False
+    assert results[1]["strategy"] == strategy.address
+    assert results[1]["success"] == True
+    assert results[2]["success"] == False
+    assert strategy.stakedBalance() > 0
+
+    # if we aren't the keeper, we don't revert, we just report a failure
+    strategy.setKeeper(gov, {"from": gov})
+    tx = keeper_wrapper.harvestMany([strategy], {"from": whale})
+    assert tx.events["HarvestResult"]["success"] == False
+
+    # but harvesting the strategy directly will still revert
+    with brownie.reverts():
+        keeper_wrapper.harvest(strategy, {"from": whale})
+
+
+# make sure our keeper wrapper only harvests strategies whose harvestTrigger is true
+def test_harvest_triggered(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    keeper_wrapper,
+):
+    ## deposit to the vault after approving
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    strategy.setKeeper(keeper_wrapper, {"from": gov})
+    chain.sleep(1)
+    chain.mine()
+
+    # nothing should trigger with a huge credit threshold and no profit
+    strategy.setCreditThreshold(2**255, {"from": gov})
+    assert strategy.harvestTrigger(0) == False
+    tx = keeper_wrapper.harvestTriggered([strategy, whale.address], 0, {"from": whale})
+    assert tx.return_value == 0
+    assert "HarvestResult" not in tx.events
+    assert strategy.stakedBalance() == 0
+
+    # once we trigger, we should harvest
+    strategy.setCreditThreshold(1, {"from": gov})
+    assert strategy.harvestTrigger(0) == True
+    tx = keeper_wrapper.harvestTriggered([strategy, whale.address], 0, {"from": whale})
+    assert tx.return_value == 1
+    assert tx.events["HarvestResult"]["strategy"] == strategy.address
+    assert tx.events["HarvestResult"]["success"] == True
+    assert strategy.stakedBalance() > 0
+
+
+# make sure our keeper wrapper can tend, staking loose want without a harvest
+def test_tend(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    keeper_wrapper,
+):
+    ## deposit to the vault after approving
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    strategy.setKeeper(keeper_wrapper, {"from": gov})
+    chain.sleep(1)
+    chain.mine()
+    keeper_wrapper.harvest(strategy, {"from": whale})
+    staked = strategy.stakedBalance()
+
+    # send some loose want to our strategy, tends are off by default
+    token.transfer(strategy, amount // 10, {"from": whale})
+    assert strategy.tendTrigger(0) == False
+
+    # only vault managers can turn on tends
+    with brownie.reverts():
+        strategy.setTendThreshold(1, {"from": whale})
+    strategy.setTendThreshold(amount // 10, {"from": gov})
+    assert strategy.tendTrigger(0) == True
+
+    # tending stakes our loose want without reporting to the vault
+    last_report = vault.strategies(strategy)["lastReport"]
+    keeper_wrapper.tend(strategy, {"from": whale})
+    assert strategy.balanceOfWant() == 0
+    assert strategy.stakedBalance() == staked + amount // 10
+    assert vault.strategies(strategy)["lastReport"] == last_report
+    assert strategy.tendTrigger(0) == False
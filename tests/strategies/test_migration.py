@@ -1,6 +1,6 @@
 import pytest
 from utils import harvest_strategy, check_status
-from brownie import accounts, interface, chain
+from brownie import accounts, interface, chain, ZERO_ADDRESS
 import brownie
 
 
@@ -59,6 +59,7 @@ def test_migration(
         contract_name,
         vault,
         gauge,
+        ZERO_ADDRESS,
         route0,
         route1,
     )
@@ -69,13 +70,19 @@ def test_migration(
             contract_name,
             vault,
             template_gauge,
+            ZERO_ADDRESS,
             route0,
             route1,
         )
 
     # make sure we can deploy VELO/USDC just fine
     test_strategy = gov.deploy(
-        contract_name, template_vault, template_gauge, template_route0, template_route1
+        contract_name,
+        template_vault,
+        template_gauge,
+        ZERO_ADDRESS,
+        template_route0,
+        template_route1,
     )
 
     with brownie.reverts("token0 route error"):
@@ -83,6 +90,7 @@ def test_migration(
             contract_name,
             vault,
             gauge,
+            ZERO_ADDRESS,
             random_route_1,
             route1,
         )
@@ -92,6 +100,7 @@ def test_migration(
             contract_name,
             vault,
             gauge,
+            ZERO_ADDRESS,
             route0,
             template_route0,
         )
@@ -101,6 +110,7 @@ def test_migration(
             contract_name,
             vault,
             gauge,
+            ZERO_ADDRESS,
             random_route_2,
             route1,
         )
@@ -110,6 +120,7 @@ def test_migration(
             contract_name,
             vault,
             gauge,
+            ZERO_ADDRESS,
             route0,
             random_route_2,
         )
@@ -268,6 +279,7 @@ def test_empty_migration(
         contract_name,
         vault,
         gauge,
+        ZERO_ADDRESS,
         route0,
         route1,
     )
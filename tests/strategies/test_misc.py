@@ -227,8 +227,23 @@ def test_setters(
         strategy.setLocalKeepVelo(100, {"from": whale})
     strategy.setLocalKeepVelo(0, {"from": gov})
 
+    # only gov can batch our keepVELO notifications
+    with brownie.reverts():
+        strategy.setMinKeepVELOToNotify(100e18, {"from": whale})
+    strategy.setMinKeepVELOToNotify(100e18, {"from": gov})
+    assert strategy.minKeepVELOToNotify() == 100e18
+    assert strategy.pendingKeepVELO() == 0
+
     # test setting a new route
     strategy.setSwapRoutes(route0, route1, {"from": gov})
+
+    # our packed routes should unpack to exactly what we set
+    for i in range(len(route0)):
+        assert strategy.swapRouteForToken0(i) == route0[i]
+    for i in range(len(route1)):
+        assert strategy.swapRouteForToken1(i) == route1[i]
+    assert strategy.veloRouteToToken0()[-1] == route0[-1][1]
+
     with brownie.reverts("token1 route error"):
         strategy.setSwapRoutes(route0, template_route0, {"from": gov})
     with brownie.reverts("token0 route error"):
@@ -237,6 +252,192 @@ def test_setters(
         strategy.setSwapRoutes(route0, route1, {"from": whale})
 
 
+# test holding keepVELO until we have enough to notify our StakingRewardsMulti contract
+def test_pending_keep_velo(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    to_sweep,
+    to_sweep_whale,
+    staking_rewards_multi,
+):
+    ## deposit to the vault after approving
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    strategy.harvest({"from": gov})
+
+    # keep 10%, but only notify once we have at least 15 VELO
+    strategy.setStakingRewardsMulti(staking_rewards_multi, {"from": gov})
+    strategy.setLocalKeepVelo(1_000, {"from": gov})
+    strategy.setMinKeepVELOToNotify(15e18, {"from": gov})
+
+    # ~10 VELO kept, so we hold onto it
+    to_sweep.transfer(strategy, 100e18, {"from": to_sweep_whale})
+    tx = strategy.harvest({"from": gov})
+    kept = tx.events["HarvestTelemetry"]["veloToRewards"]
+    assert 10e18 <= kept < 15e18
+    assert strategy.pendingKeepVELO() == kept
+    assert to_sweep.balanceOf(strategy) >= kept
+    assert to_sweep.balanceOf(staking_rewards_multi) == 0
+
+    # another ~10 VELO puts us over our minimum, so we send it all
+    to_sweep.transfer(strategy, 100e18, {"from": to_sweep_whale})
+    tx = strategy.harvest({"from": gov})
+    kept += tx.events["HarvestTelemetry"]["veloToRewards"]
+    assert strategy.pendingKeepVELO() == 0
+    assert to_sweep.balanceOf(staking_rewards_multi) == kept
+    assert tx.events["RewardAdded"]["reward"] == kept
+
+    # if gov sweeps out our VELO, we shouldn't brick our harvests
+    to_sweep.transfer(strategy, 100e18, {"from": to_sweep_whale})
+    strategy.harvest({"from": gov})
+    assert strategy.pendingKeepVELO() > 0
+    strategy.sweep(to_sweep, {"from": gov})
+    strategy.harvest({"from": gov})
+    assert strategy.pendingKeepVELO() <= to_sweep.balanceOf(strategy)
+
+    # turning off keepVELO sends out anything we're still holding
+    to_sweep.transfer(strategy, 100e18, {"from": to_sweep_whale})
+    strategy.harvest({"from": gov})
+    pending = strategy.pendingKeepVELO()
+    assert pending > 0
+    before = to_sweep.balanceOf(staking_rewards_multi)
+    strategy.setLocalKeepVelo(0, {"from": gov})
+    assert strategy.pendingKeepVELO() == 0
+    assert to_sweep.balanceOf(staking_rewards_multi) == before + pending
+
+
+# test rebalancing our leftover pool tokens into more LP
+def test_rebalance_leftovers(
+    gov,
+    whale,
+    stable_token,
+    stable_vault,
+    stable_strategy,
+    stable_whale,
+    stable_amount,
+    to_sweep,
+    to_sweep_whale,
+):
+    # rebalancing swaps on our pool directly, so use our stable pool, which isn't fee on transfer
+    strategy = stable_strategy
+    token = stable_token
+    assert strategy.isFeeOnTransfer() == False
+
+    with brownie.reverts():
+        strategy.setRebalanceLeftovers(True, {"from": whale})
+
+    ## deposit to the vault after approving
+    token.approve(stable_vault, 2**256 - 1, {"from": stable_whale})
+    stable_vault.deposit(stable_amount, {"from": stable_whale})
+    strategy.harvest({"from": gov})
+
+    # burn some LP and send our strategy only the token0 side, so it has leftovers to deal with
+    token0 = interface.IERC20(strategy.poolToken0())
+    token1 = interface.IERC20(strategy.poolToken1())
+    before = token0.balanceOf(stable_whale)
+    token.transfer(token, stable_amount // 2, {"from": stable_whale})
+    token.burn(stable_whale, {"from": stable_whale})
+    excess = token0.balanceOf(stable_whale) - before
+    token0.transfer(strategy, excess, {"from": stable_whale})
+
+    # without rebalancing, our extra token0 just sits in the strategy
+    to_sweep.transfer(strategy, 100e18, {"from": to_sweep_whale})
+    tx = strategy.harvest({"from": gov})
+    minted_without = tx.events["HarvestTelemetry"]["lpMinted"]
+    leftover_without = token0.balanceOf(strategy)
+    assert leftover_without >= excess * 9 // 10
+
+    # with it, we swap part of it through our pool and deposit the rest
+    strategy.setRebalanceLeftovers(True, {"from": gov})
+    assert strategy.rebalanceLeftovers()
+    to_sweep.transfer(strategy, 100e18, {"from": to_sweep_whale})
+    tx = strategy.harvest({"from": gov})
+    minted_with = tx.events["HarvestTelemetry"]["lpMinted"]
+    print("Token0 leftover:", leftover_without, "->", token0.balanceOf(strategy))
+    print("Token1 leftover:", token1.balanceOf(strategy))
+    assert minted_with > minted_without
+    assert token0.balanceOf(strategy) < leftover_without // 100
+
+
+# test keeping a buffer of loose want for small withdrawals
+def test_want_buffer(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    profit_whale,
+    profit_amount,
+    target,
+    is_gmx,
+):
+    with brownie.reverts():
+        strategy.setWantBuffer(1_000, {"from": whale})
+    with brownie.reverts():
+        strategy.setWantBuffer(10_001, {"from": gov})
+    strategy.setWantBuffer(1_000, {"from": gov})
+
+    ## deposit to the vault after approving
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    harvest_strategy(
+        is_gmx,
+        strategy,
+        token,
+        gov,
+        profit_whale,
+        profit_amount,
+        target,
+    )
+
+    # we should keep 10% loose
+    assert strategy.balanceOfWant() == strategy.estimatedTotalAssets() // 10
+    staked = strategy.stakedBalance()
+
+    # small withdrawals come from our buffer, without touching the gauge
+    vault.withdraw(amount // 20, {"from": whale})
+    assert strategy.stakedBalance() == staked
+
+
+# test our harvest telemetry event
+def test_harvest_telemetry(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    sleep_time,
+    no_profit,
+):
+    ## deposit to the vault after approving
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    tx = strategy.harvest({"from": gov})
+
+    # nothing to claim yet
+    telemetry = tx.events["HarvestTelemetry"]
+    assert telemetry["veloClaimed"] == 0
+    assert telemetry["lpMinted"] == 0
+
+    # simulate earnings, harvest
+    chain.sleep(sleep_time)
+    chain.mine(1)
+    tx = strategy.harvest({"from": gov})
+    telemetry = tx.events["HarvestTelemetry"]
+    print("Telemetry:", telemetry)
+    if not no_profit:
+        assert telemetry["veloClaimed"] > 0
+        assert telemetry["token0Out"] > 0
+        assert telemetry["token1Out"] > 0
+        assert telemetry["lpMinted"] > 0
+
+
 # test sweeping out tokens
 def test_sweep(
     gov,
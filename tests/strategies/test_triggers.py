@@ -23,6 +23,7 @@ def test_triggers(
     base_fee_oracle,
     use_yswaps,
     is_gmx,
+    eth_price_pool,
 ):
     # inactive strategy (0 DR and 0 assets) shouldn't be touched by keepers
     currentDebtRatio = vault.strategies(strategy)["debtRatio"]
@@ -103,6 +104,20 @@ def test_triggers(
         assert tx == True
         strategy.setHarvestTriggerParams(1_000e6, 10_000e6, {"from": gov})
 
+        # in gas aware mode, we only harvest when our profit covers our call cost
+        strategy.setGasAwareTriggerParams(20_000, eth_price_pool, {"from": gov})
+        tx = strategy.harvestTrigger(0, {"from": gov})
+        print("\nShould we harvest? Should be true.", tx)
+        assert tx == True
+        tx = strategy.harvestTrigger(1_000_000e18, {"from": gov})
+        print("\nShould we harvest? Should be false.", tx)
+        assert tx == False
+        strategy.setGasAwareTriggerParams(0, ZERO_ADDRESS, {"from": gov})
+        with brownie.reverts("need price pool"):
+            strategy.setGasAwareTriggerParams(20_000, ZERO_ADDRESS, {"from": gov})
+        with brownie.reverts("not WETH/USDC pool"):
+            strategy.setGasAwareTriggerParams(20_000, strategy.want(), {"from": gov})
+
     # set our max delay so we trigger true, then set it back to 21 days
     strategy.setMaxReportDelay(sleep_time - 1)
     tx = strategy.harvestTrigger(0, {"from": gov})
@@ -1,5 +1,5 @@
 import brownie
-from brownie import chain, interface, accounts
+from brownie import chain, interface, accounts, config, ZERO_ADDRESS
 import pytest
 from utils import harvest_strategy
 
@@ -159,6 +159,14 @@ def test_stable_vault(
     print("Token0 Route:", strategy.veloRouteToToken0())
     print("Token1 Route:", strategy.veloRouteToToken1())
 
+    # our snapshot should match our individual views
+    snapshot = strategy.strategySnapshot()
+    assert snapshot["gauge"] == strategy.gauge()
+    assert snapshot["stakedBalance"] == strategy.stakedBalance()
+    assert snapshot["balanceOfWant"] == strategy.balanceOfWant()
+    assert snapshot["veloRouteToToken0"] == strategy.veloRouteToToken0()
+    assert snapshot["veloRouteToToken1"] == strategy.veloRouteToToken1()
+
     # simulate profits
     chain.sleep(sleep_time)
 
@@ -513,3 +521,100 @@ def test_velo_vault(
         )
     else:
         assert token.balanceOf(whale) > starting_whale
+
+
+# single-hop routes through our own pool factory skip the router and swap directly on the pool
+def test_direct_pool_swap(
+    gov,
+    pm,
+    guardian,
+    rewards,
+    velo_token,
+    velo_vault,
+    velo_strategy,
+    velo_whale,
+    velo_amount,
+    to_sweep,
+    to_sweep_whale,
+    usdbc,
+    template_gauge,
+    v2_pool_factory,
+    StrategyVelodromeMultiRewards,
+):
+    strategy = velo_strategy
+    assert strategy.isFeeOnTransfer() == False
+    (route0, route1) = strategy.swapRoutes()
+    assert len(route0) == 1
+
+    ## deposit to the vault after approving
+    velo_token.approve(velo_vault, 2**256 - 1, {"from": velo_whale})
+    velo_vault.deposit(velo_amount, {"from": velo_whale})
+    strategy.harvest({"from": gov})
+
+    # AERO sorts after USDC, so we sell token1 for token0 on our pool
+    to_sweep.transfer(strategy, 100e18, {"from": to_sweep_whale})
+    tx = strategy.harvest({"from": gov})
+    swaps = [swap for swap in tx.events["Swap"] if swap.address == velo_token.address]
+    assert len(swaps) == 1
+    assert swaps[0]["sender"] == strategy.address
+    assert swaps[0]["amount1In"] > 0
+    assert swaps[0]["amount0Out"] == tx.events["HarvestTelemetry"]["token0Out"]
+
+    # AERO sorts before USDbC, so here we sell token0 for token1
+    usdbc_gauge = interface.IVeloV2Gauge(template_gauge)
+    usdbc_token = interface.IVeloPoolV2(usdbc_gauge.stakingToken())
+    assert usdbc_token.token0() == to_sweep.address
+    Vault = pm(config["dependencies"][0]).Vault
+    vault = guardian.deploy(Vault)
+    vault.initialize(usdbc_token, gov, rewards, "", "", guardian)
+    strategy = gov.deploy(
+        StrategyVelodromeMultiRewards,
+        vault,
+        usdbc_gauge,
+        ZERO_ADDRESS,
+        [],
+        [(to_sweep.address, usdbc, False, v2_pool_factory)],
+    )
+    vault.addStrategy(strategy, 10_000, 0, 2**256 - 1, 0, {"from": gov})
+
+    to_sweep.transfer(strategy, 100e18, {"from": to_sweep_whale})
+    tx = strategy.harvest({"from": gov})
+    swaps = [swap for swap in tx.events["Swap"] if swap.address == usdbc_token.address]
+    assert len(swaps) == 1
+    assert swaps[0]["sender"] == strategy.address
+    assert swaps[0]["amount0In"] > 0
+    assert swaps[0]["amount1Out"] == tx.events["HarvestTelemetry"]["token1Out"]
+
+
+# selling VELO into our own volatile pool should account for our price impact, leaving almost nothing unpaired
+def test_optimal_zap(
+    gov,
+    velo_token,
+    velo_vault,
+    velo_strategy,
+    velo_whale,
+    velo_amount,
+    to_sweep,
+    to_sweep_whale,
+):
+    strategy = velo_strategy
+    assert strategy.isStablePool() == False
+    assert strategy.poolToken1() == to_sweep.address
+
+    ## deposit to the vault after approving
+    velo_token.approve(velo_vault, 2**256 - 1, {"from": velo_whale})
+    velo_vault.deposit(velo_amount, {"from": velo_whale})
+    strategy.harvest({"from": gov})
+
+    # use a large donation so a simple half/half split would leave a noticeable amount behind
+    to_sweep.transfer(strategy, 1_000e18, {"from": to_sweep_whale})
+    tx = strategy.harvest({"from": gov})
+    telemetry = tx.events["HarvestTelemetry"]
+    assert telemetry["lpMinted"] > 0
+
+    # whatever is left of our USDC and AERO should be dust
+    token0 = interface.IERC20(strategy.poolToken0())
+    print("USDC leftover:", token0.balanceOf(strategy) / 1e6)
+    print("AERO leftover:", to_sweep.balanceOf(strategy) / 1e18)
+    assert token0.balanceOf(strategy) <= telemetry["token0Out"] // 1_000
+    assert to_sweep.balanceOf(strategy) <= telemetry["token1Out"] // 1_000